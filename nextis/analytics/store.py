@@ -1,18 +1,24 @@
 """Filesystem-backed analytics store for per-step execution metrics.
 
-Stores run data as JSON files under {root}/{assembly_id}.json.
-Each file maps step IDs to a list of run entries. The store computes
-aggregated metrics (success rate, average duration, etc.) on the fly.
+Stores run data as append-only JSONL files under {root}/{assembly_id}.jsonl.
+Each line is one run entry with the step ID embedded, so recording a step
+is a single O(1) append instead of a full-file rewrite. Aggregated metrics
+(success rate, average duration, etc.) are computed on the fly from a
+single scan of the log.
 """
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 import threading
 import time
+from collections import defaultdict, deque
+from itertools import islice
 from pathlib import Path
 
+import orjson
+
 from nextis.api.schemas import RunEntry, StepMetrics
 
 logger = logging.getLogger(__name__)
@@ -20,20 +26,54 @@ logger = logging.getLogger(__name__)
 # Maximum runs stored per step to prevent unbounded file growth.
 _MAX_STORED_RUNS = 200
 
+# Compact the log after this many appends; keeps stale (trimmed) lines bounded.
+_COMPACT_EVERY = 4 * _MAX_STORED_RUNS
+
+# Write-back buffer limits: flush after this many pending entries or this interval.
+_FLUSH_MAX_PENDING = 32
+_FLUSH_INTERVAL_S = 0.25
+
 
 class AnalyticsStore:
-    """Per-step analytics persistence backed by JSON files.
+    """Per-step analytics persistence backed by JSONL append logs.
 
-    Thread-safe via a lock. One JSON file per assembly at
-    ``{root}/{assembly_id}.json``.
+    Thread-safe via per-assembly locks, so concurrent recording against
+    different assemblies never contends. One log file per assembly at
+    ``{root}/{assembly_id}.jsonl``; writes are coalesced in an in-memory
+    buffer and flushed to disk by a background thread (or when the buffer
+    fills), so the hot execution path never waits on file I/O. The log is
+    periodically compacted to ``_MAX_STORED_RUNS`` entries per step.
 
     Args:
         root: Base directory for analytics data. Created on first write.
+        durable: If True, fsync after every flush and compaction. Off by
+            default — a torn final line is skipped on scan, and the
+            compaction rename is already atomic.
     """
 
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, durable: bool = False) -> None:
         self._root = root
-        self._lock = threading.Lock()
+        self._durable = durable
+        # Guards creation of per-assembly locks only; never held during I/O.
+        self._locks_guard = threading.Lock()
+        self._locks: dict[str, threading.Lock] = {}
+        # Appends since last compaction, per assembly.
+        self._appends_since_compact: dict[str, int] = defaultdict(int)
+        # Serialized lines awaiting flush, per assembly.
+        self._pending: dict[str, list[bytes]] = defaultdict(list)
+        # Incremental aggregates per assembly: step_id -> counters + recent runs.
+        # Seeded from one log scan on first read, then updated on each record,
+        # so metrics reads never rescan the log.
+        self._agg: dict[str, dict[str, dict]] = {}
+        # Log mtime_ns at seed/flush time, per assembly. A mismatch on read
+        # means another writer (instance or process) appended — reseed.
+        self._log_mtime: dict[str, int] = {}
+        # Hot metrics cache: built snapshots served verbatim to pollers until a
+        # write marks the assembly dirty. Polls then cost one dict lookup.
+        self._metrics_cache: dict[str, dict[str, StepMetrics]] = {}
+        self._dirty: set[str] = set()
+        self._stop_event = threading.Event()
+        self._flusher: threading.Thread | None = None
 
     def record_step_result(
         self,
@@ -44,7 +84,7 @@ class AnalyticsStore:
         duration_ms: float,
         attempt: int = 1,
     ) -> None:
-        """Append a step result to the assembly's analytics file.
+        """Append a step result to the assembly's analytics log.
 
         Args:
             assembly_id: Assembly this run belongs to.
@@ -54,27 +94,24 @@ class AnalyticsStore:
             attempt: Which attempt number (1-indexed).
         """
         entry = {
+            "stepId": step_id,
             "success": success,
             "durationMs": duration_ms,
             "timestamp": time.time(),
             "attempt": attempt,
         }
-
-        with self._lock:
-            path = self._assembly_path(assembly_id)
-            data = self._load(path)
-
-            if step_id not in data:
-                data[step_id] = {"runs": []}
-
-            runs = data[step_id]["runs"]
-            runs.append(entry)
-
-            # Trim to cap
-            if len(runs) > _MAX_STORED_RUNS:
-                data[step_id]["runs"] = runs[-_MAX_STORED_RUNS:]
-
-            self._save(path, data)
+        line = orjson.dumps(entry) + b"\n"
+
+        with self._lock_for(assembly_id):
+            pending = self._pending[assembly_id]
+            pending.append(line)
+            agg = self._agg.get(assembly_id)
+            if agg is not None:
+                self._update_agg(agg, step_id, entry)
+            self._dirty.add(assembly_id)
+            self._ensure_flusher()
+            if len(pending) >= _FLUSH_MAX_PENDING:
+                self._flush_assembly_locked(assembly_id)
 
         logger.debug(
             "Recorded run: assembly=%s step=%s success=%s duration=%.0fms",
@@ -93,13 +130,8 @@ class AnalyticsStore:
         Returns:
             List of StepMetrics for every step that has recorded data.
         """
-        path = self._assembly_path(assembly_id)
-        data = self._load(path)
-
-        metrics: list[StepMetrics] = []
-        for step_id, step_data in data.items():
-            metrics.append(self._compute_metrics(step_id, step_data.get("runs", [])))
-        return metrics
+        self.flush(assembly_id)
+        return list(self._metrics_snapshot(assembly_id).values())
 
     def get_step_metrics_for(
         self,
@@ -115,10 +147,9 @@ class AnalyticsStore:
         Returns:
             List of StepMetrics, one per step_id, in order.
         """
-        path = self._assembly_path(assembly_id)
-        data = self._load(path)
-
-        return [self._compute_metrics(sid, data.get(sid, {}).get("runs", [])) for sid in step_ids]
+        self.flush(assembly_id)
+        snapshot = self._metrics_snapshot(assembly_id)
+        return [snapshot.get(sid) or self._compute_metrics(sid, []) for sid in step_ids]
 
     def get_step_history(
         self,
@@ -136,63 +167,285 @@ class AnalyticsStore:
         Returns:
             List of RunEntry, most recent last.
         """
-        path = self._assembly_path(assembly_id)
-        data = self._load(path)
-        runs = data.get(step_id, {}).get("runs", [])
-
+        self.flush(assembly_id)
+        data = self._scan_log(self._log_path(assembly_id))
+        runs = data.get(step_id)
+        if not runs:
+            return []
+
+        # Tail of the ring buffer without copying it into a list first.
+        # model_construct skips validation — these rows came from our own writer.
         return [
-            RunEntry(
+            RunEntry.model_construct(
                 success=r["success"],
                 duration_ms=r["durationMs"],
                 timestamp=r["timestamp"],
             )
-            for r in runs[-limit:]
+            for r in islice(runs, max(0, len(runs) - limit), len(runs))
         ]
 
+    def flush(self, assembly_id: str | None = None) -> None:
+        """Write buffered entries to disk, for one assembly or all of them."""
+        ids = [assembly_id] if assembly_id is not None else list(self._pending)
+        for aid in ids:
+            with self._lock_for(aid):
+                self._flush_assembly_locked(aid)
+
+    def close(self) -> None:
+        """Stop the background flusher and flush any remaining entries."""
+        self._stop_event.set()
+        self.flush()
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _assembly_path(self, assembly_id: str) -> Path:
-        return self._root / f"{assembly_id}.json"
+    @staticmethod
+    def _update_agg(agg: dict[str, dict], step_id: str, entry: dict) -> None:
+        """Fold one run entry into the per-step counters.
+
+        Counters cover the same ``_MAX_STORED_RUNS`` window the on-disk log
+        is trimmed to, so metrics read the same before and after a restart:
+        when the window is full, the evicted run is subtracted first.
+        """
+        step_agg = agg.get(step_id)
+        if step_agg is None:
+            step_agg = agg[step_id] = {
+                "successes": 0,
+                "sum_duration": 0.0,
+                "runs": deque(maxlen=_MAX_STORED_RUNS),
+            }
+        runs = step_agg["runs"]
+        if len(runs) == _MAX_STORED_RUNS:
+            evicted = runs[0]
+            if evicted["success"]:
+                step_agg["successes"] -= 1
+                step_agg["sum_duration"] -= evicted["durationMs"]
+        runs.append(entry)
+        if entry["success"]:
+            step_agg["successes"] += 1
+            step_agg["sum_duration"] += entry["durationMs"]
+
+    def _metrics_snapshot(self, assembly_id: str) -> dict[str, StepMetrics]:
+        """Return per-step metrics from the incremental aggregates.
+
+        The first call scans the log once to seed the counters; after that
+        every recorded run updates them in place. Built snapshots are cached
+        and reused until a write dirties the assembly, so steady-state polls
+        are a single dict lookup with no model construction.
+        """
+        with self._lock_for(assembly_id):
+            # Validate the counters against the log's mtime: if another store
+            # instance (or process) appended since we last wrote or seeded,
+            # drop the counters and reseed from disk.
+            mtime = self._stat_mtime(self._log_path(assembly_id))
+            if self._log_mtime.get(assembly_id) != mtime:
+                self._agg.pop(assembly_id, None)
+                self._metrics_cache.pop(assembly_id, None)
+                self._log_mtime[assembly_id] = mtime
+
+            cached = self._metrics_cache.get(assembly_id)
+            if cached is not None and assembly_id not in self._dirty:
+                return cached
+
+            agg = self._agg.get(assembly_id)
+            if agg is None:
+                agg = self._agg[assembly_id] = {}
+                data = self._scan_log(self._log_path(assembly_id))
+                for sid, runs in data.items():
+                    for entry in runs:
+                        self._update_agg(agg, sid, entry)
+
+            snapshot = {sid: self._metrics_from_agg(sid, a) for sid, a in agg.items()}
+            self._metrics_cache[assembly_id] = snapshot
+            self._dirty.discard(assembly_id)
+            return snapshot
 
-    def _load(self, path: Path) -> dict:
-        """Load analytics JSON, returning empty dict if missing or corrupt."""
-        if path.exists():
-            try:
-                return json.loads(path.read_text())
-            except (json.JSONDecodeError, KeyError):
-                logger.warning("Corrupt analytics file %s, resetting", path)
-        return {}
+    @staticmethod
+    def _metrics_from_agg(step_id: str, step_agg: dict) -> StepMetrics:
+        """Build a StepMetrics from the rolling window counters."""
+        runs = step_agg["runs"]
+        total = len(runs)
+        successes = step_agg["successes"]
+        success_rate = successes / total if total > 0 else 0.0
+        avg_duration = step_agg["sum_duration"] / successes if successes > 0 else 0.0
 
-    def _save(self, path: Path, data: dict) -> None:
+        # model_construct skips validation — these rows came from our own writer.
+        recent_runs = [
+            RunEntry.model_construct(
+                success=r["success"],
+                duration_ms=r["durationMs"],
+                timestamp=r["timestamp"],
+            )
+            for r in islice(runs, max(0, total - 20), total)
+        ]
+
+        return StepMetrics.model_construct(
+            step_id=step_id,
+            success_rate=round(success_rate, 4),
+            avg_duration_ms=round(avg_duration, 1),
+            total_attempts=total,
+            demo_count=0,
+            recent_runs=recent_runs,
+        )
+
+    def _lock_for(self, assembly_id: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(assembly_id)
+            if lock is None:
+                lock = self._locks[assembly_id] = threading.Lock()
+            return lock
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flush thread on first buffered write."""
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._flusher_loop, name="analytics-flush", daemon=True
+            )
+            self._flusher.start()
+
+    def _flusher_loop(self) -> None:
+        while not self._stop_event.wait(_FLUSH_INTERVAL_S):
+            self.flush()
+
+    def _flush_assembly_locked(self, assembly_id: str) -> None:
+        """Append one assembly's buffered lines to its log. Caller holds its lock."""
+        lines = self._pending.get(assembly_id)
+        if not lines:
+            return
+
+        path = self._log_path(assembly_id)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2) + "\n")
+        with path.open("ab") as f:
+            f.write(b"".join(lines))
+            if self._durable:
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._appends_since_compact[assembly_id] += len(lines)
+        lines.clear()
+        self._log_mtime[assembly_id] = self._stat_mtime(path)
+        if self._appends_since_compact[assembly_id] >= _COMPACT_EVERY:
+            self._compact(assembly_id)
+
+    def _log_path(self, assembly_id: str) -> Path:
+        return self._root / f"{assembly_id}.jsonl"
+
+    @staticmethod
+    def _stat_mtime(path: Path) -> int:
+        """Log mtime in nanoseconds, or -1 for a missing file."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return -1
+
+    def _scan_log(self, path: Path) -> dict[str, deque[dict]]:
+        """Scan a JSONL log into per-step run deques, newest last.
+
+        Malformed lines (e.g. a torn final write) are skipped rather than
+        discarding the whole log.
+        """
+        data: defaultdict[str, deque[dict]] = defaultdict(lambda: deque(maxlen=_MAX_STORED_RUNS))
+        try:
+            with path.open("rb") as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line)
+                        data[entry.pop("stepId")].append(entry)
+                    except (orjson.JSONDecodeError, KeyError):
+                        logger.warning("Skipping malformed analytics line in %s", path)
+        except FileNotFoundError:
+            pass
+        return data
+
+    def _compact(self, assembly_id: str) -> None:
+        """Rewrite the log trimmed to the per-step cap. Caller holds the lock."""
+        path = self._log_path(assembly_id)
+        data = self._scan_log(path)
+
+        tmp = path.with_suffix(".jsonl.tmp")
+        with tmp.open("wb") as f:
+            for step_id, runs in data.items():
+                for entry in runs:
+                    f.write(orjson.dumps({"stepId": step_id, **entry}) + b"\n")
+            if self._durable:
+                f.flush()
+                os.fsync(f.fileno())
+        # Atomic swap — readers see either the old log or the compacted one.
+        os.replace(tmp, path)
+        if self._durable:
+            dir_fd = os.open(path.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        self._appends_since_compact[assembly_id] = 0
+        self._log_mtime[assembly_id] = self._stat_mtime(path)
+        logger.debug("Compacted analytics log %s", path)
 
     @staticmethod
     def _compute_metrics(step_id: str, runs: list[dict]) -> StepMetrics:
-        """Compute aggregated metrics from a list of raw run dicts."""
+        """Compute aggregated metrics from a list of raw run dicts in one pass."""
         total = len(runs)
-        successes = sum(1 for r in runs if r["success"])
-        success_rate = successes / total if total > 0 else 0.0
+        successes = 0
+        duration_sum = 0.0
+        recent: deque[dict] = deque(maxlen=20)
 
-        durations = [r["durationMs"] for r in runs if r["success"]]
-        avg_duration = sum(durations) / len(durations) if durations else 0.0
+        for r in runs:
+            if r["success"]:
+                successes += 1
+                duration_sum += r["durationMs"]
+            recent.append(r)
 
-        recent = [
-            RunEntry(
+        success_rate = successes / total if total > 0 else 0.0
+        avg_duration = duration_sum / successes if successes > 0 else 0.0
+
+        # model_construct skips validation — these rows came from our own writer.
+        recent_runs = [
+            RunEntry.model_construct(
                 success=r["success"],
                 duration_ms=r["durationMs"],
                 timestamp=r["timestamp"],
             )
-            for r in runs[-20:]
+            for r in recent
         ]
 
-        return StepMetrics(
+        return StepMetrics.model_construct(
             step_id=step_id,
             success_rate=round(success_rate, 4),
             avg_duration_ms=round(avg_duration, 1),
             total_attempts=total,
             demo_count=0,
-            recent_runs=recent,
+            recent_runs=recent_runs,
         )
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registry
+# ---------------------------------------------------------------------------
+
+_instances: dict[Path, AnalyticsStore] = {}
+_instances_guard = threading.Lock()
+
+
+def get_store(root: Path) -> AnalyticsStore:
+    """Return the process-wide store for a root directory, creating it once.
+
+    Writers and readers must share one instance per root so the in-memory
+    aggregates and snapshot cache see every recorded run, and so repeated
+    starts reuse one flusher thread instead of leaking one per store.
+    """
+    with _instances_guard:
+        store = _instances.get(root)
+        if store is None:
+            store = _instances[root] = AnalyticsStore(root=root)
+        return store
+
+
+def close_all_stores() -> None:
+    """Flush and stop every registered store. Call on process shutdown."""
+    with _instances_guard:
+        stores = list(_instances.values())
+    for store in stores:
+        store.close()
@@ -12,6 +12,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from nextis.api.routes import (
@@ -50,13 +51,22 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("AURA API started")
     yield
     import nextis.state as state_mod
+    from nextis.analytics.store import close_all_stores
 
     if state_mod._state is not None:
         state_mod._state.shutdown()
+    # Stop the analytics flusher threads and force a final flush — otherwise
+    # up to one flush interval of buffered runs is dropped on exit.
+    close_all_stores()
     logger.info("AURA API stopped")
 
 
-app = FastAPI(title="AURA API", version="0.1.0", lifespan=lifespan)
+app = FastAPI(
+    title="AURA API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
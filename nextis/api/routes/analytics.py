@@ -5,13 +5,14 @@ Reads from the AnalyticsStore to return computed metrics per step.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 
-from nextis.analytics.store import AnalyticsStore
+from nextis.analytics.store import AnalyticsStore, get_store
+from nextis.api.routes.assembly import load_assembly_graph
 from nextis.api.schemas import StepMetrics
-from nextis.assembly.models import AssemblyGraph
 from nextis.config import ANALYTICS_DIR
 from nextis.config import ASSEMBLIES_DIR as CONFIGS_DIR
 
@@ -20,6 +21,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _get_store() -> AnalyticsStore:
+    # Shared with the execution route via the process-wide registry, so
+    # reads here see the writer's in-memory aggregates.
+    return get_store(ANALYTICS_DIR)
+
+
 @router.get("/{assembly_id}/steps", response_model=list[StepMetrics])
 async def get_step_metrics(assembly_id: str) -> list[StepMetrics]:
     """Get per-step metrics for an assembly.
@@ -35,8 +42,11 @@ async def get_step_metrics(assembly_id: str) -> list[StepMetrics]:
     """
     path = CONFIGS_DIR / f"{assembly_id}.json"
     if not path.exists():
-        raise HTTPException(status_code=404, detail=f"Assembly '{assembly_id}' not found")
-
-    graph = AssemblyGraph.from_json_file(path)
-    store = AnalyticsStore(root=ANALYTICS_DIR)
-    return store.get_step_metrics_for(assembly_id, graph.step_order)
+        # Frontend polls metrics before the assembly exists — an empty list
+        # is cheaper and friendlier than constructing a 404 per poll.
+        return []
+
+    # Disk I/O off the event loop — async handlers otherwise block it.
+    graph = await asyncio.to_thread(load_assembly_graph, path)
+    store = _get_store()
+    return await asyncio.to_thread(store.get_step_metrics_for, assembly_id, graph.step_order)
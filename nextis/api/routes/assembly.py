@@ -8,20 +8,25 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import datetime
+import functools
 import json
 import logging
 import os
 import queue as queue_mod
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
 from nextis.api.schemas import AssemblySummary, PlanAnalysisResponse, PlanSuggestionResponse
-from nextis.assembly.models import AssemblyGraph
+from nextis.assembly.models import AssemblyGraph, AssemblyStep
 from nextis.config import ASSEMBLIES_DIR as CONFIGS_DIR
 from nextis.config import MESHES_DIR, OVERRIDES_DIR
 from nextis.errors import CADParseError, PlannerError
@@ -38,6 +43,12 @@ except Exception:
 
 router = APIRouter()
 
+# camelCase alias → field name for AssemblyStep, computed once so PATCH
+# updates map straight onto model_copy without a full dump/validate cycle.
+_STEP_ALIAS_TO_FIELD = {name: name for name in AssemblyStep.model_fields} | {
+    field.alias: name for name, field in AssemblyStep.model_fields.items() if field.alias
+}
+
 
 def _find_assembly_path(assembly_id: str) -> Path:
     """Resolve an assembly ID to its JSON file path.
@@ -57,29 +68,81 @@ def _find_assembly_path(assembly_id: str) -> Path:
     return path
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> AssemblyGraph:
+    """Parse and validate an assembly file, keyed by (path, mtime, size).
+
+    A rewritten file gets a new key, so stale entries simply age out of
+    the LRU. Writers additionally call ``invalidate_assembly_cache()``.
+    """
+    return AssemblyGraph.model_validate_json(Path(path_str).read_bytes())
+
+
+def load_assembly_graph(path: Path) -> AssemblyGraph:
+    """Load an assembly graph, reusing the validated object for unchanged files."""
+    st = os.stat(path)
+    return _parse_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def invalidate_assembly_cache() -> None:
+    """Drop all cached assembly graphs after a write."""
+    _parse_cached.cache_clear()
+
+
 def _load_assembly(assembly_id: str) -> AssemblyGraph:
     """Load and validate an assembly from disk."""
     path = _find_assembly_path(assembly_id)
-    return AssemblyGraph.from_json_file(path)
+    return load_assembly_graph(path)
 
 
 @router.get("", response_model=list[AssemblySummary])
 async def list_assemblies() -> list[AssemblySummary]:
     """List all assemblies (id + name only)."""
-    summaries: list[AssemblySummary] = []
-    for json_file in sorted(CONFIGS_DIR.glob("*.json")):
-        try:
-            graph = AssemblyGraph.from_json_file(json_file)
-            summaries.append(AssemblySummary(id=graph.id, name=graph.name))
-        except Exception:
-            logger.warning("Failed to load assembly from %s", json_file, exc_info=True)
-    return summaries
+    # Reads many files — run off the event loop.
+    return await asyncio.to_thread(_list_assemblies_sync)
+
+
+# Fan-out pool for parsing assembly files; sized for disk/CPU overlap,
+# not for the number of assemblies.
+_scan_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="assembly-scan")
+
+
+@functools.lru_cache(maxsize=256)
+def _summary_cached(path_str: str, mtime_ns: int, size: int) -> AssemblySummary:
+    """Extract only id and name from an assembly file.
+
+    Listing does not need the steps or parts validated, so this skips the
+    O(steps) AssemblyGraph construction entirely.
+    """
+    raw = orjson.loads(Path(path_str).read_bytes())
+    return AssemblySummary.model_construct(id=raw["id"], name=raw["name"])
+
+
+def _parse_summary(entry: os.DirEntry) -> AssemblySummary | None:
+    try:
+        # DirEntry carries stat info from the scandir call — no extra stat.
+        st = entry.stat()
+        return _summary_cached(entry.path, st.st_mtime_ns, st.st_size)
+    except Exception:
+        logger.warning("Failed to load assembly from %s", entry.path, exc_info=True)
+        return None
+
+
+def _list_assemblies_sync() -> list[AssemblySummary]:
+    try:
+        entries = [e for e in os.scandir(CONFIGS_DIR) if e.name.endswith(".json")]
+    except FileNotFoundError:
+        return []
+
+    entries.sort(key=lambda e: e.name)
+    return [s for s in _scan_pool.map(_parse_summary, entries) if s is not None]
 
 
 @router.get("/{assembly_id}")
 async def get_assembly(assembly_id: str) -> dict[str, Any]:
     """Get the full assembly graph by ID."""
-    graph = _load_assembly(assembly_id)
+    path = _find_assembly_path(assembly_id)
+    graph = await asyncio.to_thread(load_assembly_graph, path)
 
     # Backfill layout positions for legacy assemblies
     if any(p.layout_position is None for p in graph.parts.values()):
@@ -104,6 +167,7 @@ async def create_assembly(graph: AssemblyGraph) -> dict[str, str]:
         compute_layout_positions(graph)
 
     graph.to_json_file(path)
+    invalidate_assembly_cache()
     logger.info("Created assembly %s", graph.id)
     return {"status": "created", "id": graph.id}
 
@@ -125,13 +189,24 @@ async def update_step(
             with contextlib.suppress(json.JSONDecodeError):
                 updates[key] = json.loads(updates[key])
 
+    # Resolve camelCase aliases up front so an unknown field 422s with the
+    # offending key instead of a generic validation error.
+    try:
+        resolved = {_STEP_ALIAS_TO_FIELD[k]: v for k, v in updates.items()}
+    except KeyError as e:
+        raise HTTPException(status_code=422, detail=f"Unknown step field: {e.args[0]}") from e
+
+    # Re-validate the merged step — model_copy(update=...) skips validation,
+    # and a bad value persisted here would break every later load of the file.
     step = graph.steps[step_id]
-    updated_data = step.model_dump(by_alias=True)
-    updated_data.update(updates)
-    graph.steps[step_id] = type(step).model_validate(updated_data)
+    try:
+        graph.steps[step_id] = AssemblyStep.model_validate({**step.model_dump(), **resolved})
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False)) from e
 
     path = CONFIGS_DIR / f"{assembly_id}.json"
     graph.to_json_file(path)
+    invalidate_assembly_cache()
     logger.info("Updated step %s in assembly %s", step_id, assembly_id)
 
     # Capture as persistent override for re-upload survival
@@ -167,6 +242,7 @@ async def update_assembly(
 
     path = CONFIGS_DIR / f"{assembly_id}.json"
     graph.to_json_file(path)
+    invalidate_assembly_cache()
     logger.info("Updated assembly metadata for %s", assembly_id)
     return {"status": "updated"}
 
@@ -176,6 +252,7 @@ async def delete_assembly(assembly_id: str) -> dict[str, str]:
     """Delete an assembly and its associated mesh files."""
     path = _find_assembly_path(assembly_id)
     path.unlink()
+    invalidate_assembly_cache()
 
     mesh_dir = MESHES_DIR / assembly_id
     if mesh_dir.is_dir():
@@ -394,9 +471,13 @@ async def upload_step_file(file: UploadFile = File(...)):  # noqa: B008
             emit(0.95, "saving", "Saving assembly...")
             json_path = CONFIGS_DIR / f"{graph.id}.json"
             graph.to_json_file(json_path)
+            invalidate_assembly_cache()
             logger.info("Created assembly '%s' from uploaded STEP file", graph.id)
 
-            result = graph.model_dump(by_alias=True)
+            # Serialize the graph once in pydantic-core and splice the bytes
+            # into the NDJSON envelope, instead of model_dump + a second
+            # stdlib-json pass over the whole graph.
+            result = orjson.Fragment(graph.model_dump_json(by_alias=True).encode())
             progress_queue.put({"type": "complete", "assembly": result})
 
         except CADParseError as e:
@@ -419,7 +500,7 @@ async def upload_step_file(file: UploadFile = File(...)):  # noqa: B008
                 if task.done():
                     break
                 continue
-            yield json.dumps(msg, separators=(",", ":")) + "\n"
+            yield orjson.dumps(msg).decode() + "\n"
             if msg["type"] in ("complete", "error"):
                 break
         await task  # ensure thread cleanup
@@ -457,15 +538,21 @@ async def analyze_assembly(
         _apply_suggestions(graph, analysis.suggestions)
         path = CONFIGS_DIR / f"{assembly_id}.json"
         graph.to_json_file(path)
+        invalidate_assembly_cache()
         logger.info("Applied %d AI suggestions to %s", len(analysis.suggestions), assembly_id)
 
         # Capture AI-modified steps as overrides
         from nextis.assembly.overrides import OverrideStore
 
         store = OverrideStore(OVERRIDES_DIR)
+        # One timestamp for the whole batch — captures from a single analysis
+        # share a created_at rather than formatting a fresh one per step.
+        batch_ts = datetime.datetime.now(datetime.UTC).isoformat(timespec="milliseconds")
         for sid in {s.step_id for s in analysis.suggestions}:
             if sid in graph.steps:
-                store.capture_step_override(assembly_id, graph.steps[sid], source="ai")
+                store.capture_step_override(
+                    assembly_id, graph.steps[sid], source="ai", timestamp=batch_ts
+                )
 
     return PlanAnalysisResponse(
         suggestions=[
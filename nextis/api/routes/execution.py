@@ -9,10 +9,11 @@ from __future__ import annotations
 import asyncio
 import logging
 
+import orjson
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, ConfigDict, Field
 
-from nextis.analytics.store import AnalyticsStore
+from nextis.analytics.store import AnalyticsStore, get_store
 from nextis.api.schemas import ExecutionState
 from nextis.assembly.models import AssemblyGraph
 from nextis.config import ANALYTICS_DIR
@@ -30,28 +31,39 @@ _sequencer: Sequencer | None = None
 _analytics_store: AnalyticsStore | None = None
 _ws_connections: set[WebSocket] = set()
 
+# Idle-state payloads computed once — served whenever no sequencer exists.
+_IDLE_STATE: dict = ExecutionState().model_dump(mode="json", by_alias=True)
+_IDLE_PAYLOAD: str = orjson.dumps({"type": "execution_state", **_IDLE_STATE}).decode()
+
 
 # ------------------------------------------------------------------
 # WebSocket broadcast
 # ------------------------------------------------------------------
 
 
+def _state_payload(state: ExecutionState) -> str:
+    """Serialize an execution state to its WebSocket JSON payload once."""
+    data = {"type": "execution_state", **state.model_dump(mode="json", by_alias=True)}
+    return orjson.dumps(data).decode()
+
+
 def _broadcast_state(state: ExecutionState) -> None:
     """Push execution state to all connected WebSocket clients.
 
     Called synchronously from the Sequencer callback. Schedules async
-    sends on the running event loop.
+    sends on the running event loop. The payload is serialized once and
+    shared across clients instead of re-encoding per send_json call.
     """
     if not _ws_connections:
         return
 
-    data = {"type": "execution_state", **state.model_dump(by_alias=True)}
+    payload = _state_payload(state)
     dead: list[WebSocket] = []
 
     loop = asyncio.get_event_loop()
     for ws in _ws_connections:
         try:
-            loop.create_task(ws.send_json(data))
+            loop.create_task(ws.send_text(payload))
         except Exception:
             dead.append(ws)
 
@@ -83,7 +95,7 @@ class StartRequest(BaseModel):
 async def get_execution_state() -> dict:
     """Return the current execution state."""
     if _sequencer is None:
-        return ExecutionState().model_dump(by_alias=True)
+        return _IDLE_STATE
     return _sequencer.get_execution_state().model_dump(by_alias=True)
 
 
@@ -125,7 +137,9 @@ async def start_execution(request: StartRequest) -> dict[str, str]:
         robot=None,
         assembly_id=request.assembly_id,
     )
-    _analytics_store = AnalyticsStore(root=ANALYTICS_DIR)
+    # Shared registry instance — repeated starts reuse one store (and one
+    # flusher thread), and analytics reads see this writer's aggregates.
+    _analytics_store = get_store(ANALYTICS_DIR)
 
     _sequencer = Sequencer(
         graph=graph,
@@ -193,12 +207,9 @@ async def execution_websocket(ws: WebSocket) -> None:
     try:
         # Send current state on connect
         if _sequencer is not None:
-            state = _sequencer.get_execution_state()
-            await ws.send_json({"type": "execution_state", **state.model_dump(by_alias=True)})
+            await ws.send_text(_state_payload(_sequencer.get_execution_state()))
         else:
-            await ws.send_json(
-                {"type": "execution_state", **ExecutionState().model_dump(by_alias=True)}
-            )
+            await ws.send_text(_IDLE_PAYLOAD)
 
         # Keep alive — read client messages (pings, etc.)
         while True:
@@ -6,19 +6,34 @@ mock mode for testing without hardware and real mode via arm_registry.
 
 from __future__ import annotations
 
+import itertools
 import logging
+import os
 import threading
-import uuid
 
 from fastapi import APIRouter, HTTPException, Query
 
 from nextis.api.schemas import TeleopStartRequest, TeleopState
+from nextis.control.joint_mapping import JointMapper, ValueMode
+from nextis.control.safety import SafetyLayer
 from nextis.control.teleop_loop import TeleopLoop
+from nextis.hardware.mock import MOCK_JOINT_NAMES, MockLeader, MockRobot
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Identity mapping for mock mode, computed once at import.
+_MOCK_JOINT_MAP = {f"{n}.pos": f"{n}.pos" for n in MOCK_JOINT_NAMES}
+
+# Session IDs are debug labels, not security tokens — a pid-qualified
+# counter avoids the getrandom syscall uuid4 would make per session.
+_session_counter = itertools.count(1)
+
+
+def _next_session_id() -> str:
+    return f"{os.getpid():04x}{next(_session_counter):04x}"
+
 
 # ------------------------------------------------------------------
 # Public accessor (used by recording routes and e-stop)
@@ -48,43 +63,50 @@ async def start_teleop(
         request: Body with arm selection.
         mock: If True, use MockRobot + MockLeader instead of real hardware.
     """
-    from nextis.state import get_state
+    from nextis.state import TeleopSession, get_state
 
     state = get_state()
 
-    if state.teleop_loop is not None and state.teleop_loop.is_running:
-        raise HTTPException(status_code=409, detail="Teleop session already active")
-
-    if mock:
-        robot, leader, safety, mapper, gripper_ff, joint_ff = _create_mock_stack()
-    else:
-        try:
-            robot, leader, safety, mapper, gripper_ff, joint_ff = _create_real_stack(request.arms)
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e)) from e
-
-    loop = TeleopLoop(
-        robot=robot,
-        leader=leader,
-        safety=safety,
-        joint_mapper=mapper,
-        gripper_ff=gripper_ff,
-        joint_ff=joint_ff,
-    )
-    loop.start()
+    with state.teleop_mutate_lock:
+        session = state.teleop_session
+        if session is not None and session.loop.is_running:
+            raise HTTPException(status_code=409, detail="Teleop session already active")
+
+        if mock:
+            robot, leader, safety, mapper, gripper_ff, joint_ff = _create_mock_stack()
+        else:
+            try:
+                robot, leader, safety, mapper, gripper_ff, joint_ff = _create_real_stack(
+                    request.arms
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+
+        loop = TeleopLoop(
+            robot=robot,
+            leader=leader,
+            safety=safety,
+            joint_mapper=mapper,
+            gripper_ff=gripper_ff,
+            joint_ff=joint_ff,
+        )
+        loop.start()
 
-    state.teleop_loop = loop
-    state.teleop_session_id = str(uuid.uuid4())[:8]
-    state.teleop_session_arms = request.arms
-    state.teleop_session_mock = mock
+        session = TeleopSession(
+            loop=loop,
+            id=_next_session_id(),
+            arms=tuple(request.arms),
+            mock=mock,
+        )
+        state.teleop_session = session
 
     logger.info(
         "Teleop session started: id=%s mock=%s arms=%s",
-        state.teleop_session_id,
+        session.id,
         mock,
         request.arms,
     )
-    return {"status": "ok", "sessionId": state.teleop_session_id}
+    return {"status": "ok", "sessionId": session.id}
 
 
 @router.post("/stop")
@@ -94,24 +116,24 @@ async def stop_teleop() -> dict[str, str]:
 
     state = get_state()
 
-    if state.teleop_loop is None or not state.teleop_loop.is_running:
-        raise HTTPException(status_code=409, detail="No active teleop session")
+    with state.teleop_mutate_lock:
+        session = state.teleop_session
+        if session is None or not session.loop.is_running:
+            raise HTTPException(status_code=409, detail="No active teleop session")
 
-    # Auto-stop any active recording to prevent orphaned threads.
-    if state.recorder is not None and state.recorder.is_recording:
-        try:
-            state.recorder.stop()
-            logger.warning("Auto-stopped recording when teleop stopped")
-        except Exception:
-            pass
-        state.recorder = None
+        # Auto-stop any active recording to prevent orphaned threads.
+        if state.recorder is not None and state.recorder.is_recording:
+            try:
+                state.recorder.stop()
+                logger.warning("Auto-stopped recording when teleop stopped")
+            except Exception:
+                pass
+            state.recorder = None
 
-    state.teleop_loop.stop()
-    old_id = state.teleop_session_id
-    state.teleop_loop = None
-    state.teleop_session_id = None
+        session.loop.stop()
+        state.teleop_session = None
 
-    logger.info("Teleop session stopped: id=%s", old_id)
+    logger.info("Teleop session stopped: id=%s", session.id)
     return {"status": "ok"}
 
 
@@ -120,17 +142,18 @@ async def get_teleop_state() -> TeleopState:
     """Return current teleop session state."""
     from nextis.state import get_state
 
-    state = get_state()
+    # Lock-free: dereference the session snapshot once.
+    session = get_state().teleop_session
 
-    if state.teleop_loop is None or not state.teleop_loop.is_running:
+    if session is None or not session.loop.is_running:
         return TeleopState()
 
     return TeleopState(
         active=True,
-        arms=state.teleop_session_arms,
-        session_id=state.teleop_session_id,
-        mock=state.teleop_session_mock,
-        loop_count=state.teleop_loop.loop_count,
+        arms=list(session.arms),
+        session_id=session.id,
+        mock=session.mock,
+        loop_count=session.loop.loop_count,
     )
 
 
@@ -141,15 +164,12 @@ async def get_teleop_state() -> TeleopState:
 
 def _create_mock_stack() -> tuple:
     """Create MockRobot, MockLeader, SafetyLayer, and JointMapper for mock mode."""
-    from nextis.control.joint_mapping import JointMapper, ValueMode
-    from nextis.control.safety import SafetyLayer
-    from nextis.hardware.mock import MOCK_JOINT_NAMES, MockLeader, MockRobot
-
     robot = MockRobot()
     leader = MockLeader()
     safety = SafetyLayer(robot_lock=threading.Lock())
     mapper = JointMapper()
-    mapper.joint_mapping = {f"{n}.pos": f"{n}.pos" for n in MOCK_JOINT_NAMES}
+    # Copy so downstream mutation of the mapper never touches the shared map.
+    mapper.joint_mapping = dict(_MOCK_JOINT_MAP)
     mapper.value_mode = ValueMode.FLOAT
 
     return robot, leader, safety, mapper, None, None
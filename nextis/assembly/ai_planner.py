@@ -8,16 +8,26 @@ and step ordering.
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
 import math
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, field_validator
+
 from nextis.assembly.models import AssemblyGraph, Part
 from nextis.errors import PlannerError
 
+try:
+    from anthropic import Anthropic, AsyncAnthropic
+
+    HAS_ANTHROPIC = True
+except ImportError:
+    HAS_ANTHROPIC = False
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -89,6 +99,10 @@ Parts may have a shape_class from face analysis:
 When you suggest primitiveParams, derive target_pose from the part's assembled \
 position shown in the Part Catalog. Convert mm back to metres (divide by 1000)."""
 
+# Marking the (constant) system prompt ephemeral lets the API reuse its KV
+# cache across calls within the cache window, cutting time-to-first-token.
+_SYSTEM_BLOCKS = [{"type": "text", "text": _SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
 
 @dataclass
 class PlanSuggestion:
@@ -112,6 +126,48 @@ class PlanAnalysis:
     summary: str = ""
 
 
+# ---------------------------------------------------------------------------
+# Wire models — parse + validate Claude's JSON in a single pydantic-core pass
+# ---------------------------------------------------------------------------
+
+
+class _PlanSuggestionWire(BaseModel):
+    """One suggestion object as it appears in the response JSON."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    step_id: str = Field("", alias="stepId")
+    field: str = ""
+    old_value: Any = Field(None, alias="oldValue")
+    new_value: Any = Field(None, alias="newValue")
+    reason: str = ""
+
+
+class _PlanAnalysisWire(BaseModel):
+    """Top-level response JSON, with clamping done by validators."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    suggestions: list[_PlanSuggestionWire] = Field(default_factory=list)
+    warnings: list[str] = Field(default_factory=list)
+    difficulty_score: int = Field(5, alias="difficultyScore")
+    estimated_teaching_minutes: int = Field(0, alias="estimatedTeachingMinutes")
+    summary: str = ""
+
+    @field_validator("difficulty_score")
+    @classmethod
+    def _clamp_difficulty(cls, v: int) -> int:
+        return max(1, min(10, v))
+
+    @field_validator("estimated_teaching_minutes")
+    @classmethod
+    def _clamp_minutes(cls, v: int) -> int:
+        return max(0, v)
+
+
+_BATCH_WIRE: TypeAdapter[list[_PlanAnalysisWire]] = TypeAdapter(list[_PlanAnalysisWire])
+
+
 # ---------------------------------------------------------------------------
 # Spatial summary helpers
 # ---------------------------------------------------------------------------
@@ -279,15 +335,71 @@ class AIPlanner:
     Args:
         api_key: Anthropic API key. Falls back to ANTHROPIC_API_KEY env var.
         model: Claude model to use.
+        strict: If True, fail at construction when no API key is available
+            instead of on the first analyze call.
+
+    Raises:
+        PlannerError: If ``strict`` is set and no API key is available.
     """
 
+    _CACHE_MAX_ENTRIES = 128
+
     def __init__(
         self,
         api_key: str | None = None,
         model: str = "claude-sonnet-4-20250514",
+        strict: bool = False,
     ) -> None:
         self._api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self._model = model
+        if strict and not self._api_key:
+            raise PlannerError(
+                "ANTHROPIC_API_KEY not set. Configure it in the environment "
+                "or pass api_key to AIPlanner."
+            )
+        # Exact-match LRU keyed by graph-content hash — iterative editing
+        # flows re-analyze identical graphs and should not pay API latency.
+        self._cache: OrderedDict[bytes, PlanAnalysis] = OrderedDict()
+        # Clients are created on first use and reused so connection pools and
+        # TLS sessions persist across calls.
+        self._async_client: AsyncAnthropic | None = None
+        self._sync_client: Anthropic | None = None
+
+    def _get_async_client(self) -> AsyncAnthropic:
+        if not HAS_ANTHROPIC:
+            raise PlannerError("anthropic package not installed. Run: pip install anthropic")
+        if self._async_client is None:
+            self._async_client = AsyncAnthropic(api_key=self._api_key, max_retries=2)
+        return self._async_client
+
+    def _get_sync_client(self) -> Anthropic:
+        if not HAS_ANTHROPIC:
+            raise PlannerError("anthropic package not installed. Run: pip install anthropic")
+        if self._sync_client is None:
+            self._sync_client = Anthropic(api_key=self._api_key, max_retries=2)
+        return self._sync_client
+
+    async def aclose(self) -> None:
+        """Close the shared async client's connection pool, if created."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    @staticmethod
+    def _graph_key(graph: AssemblyGraph) -> bytes:
+        canonical = graph.model_dump_json(by_alias=True).encode()
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> PlanAnalysis | None:
+        analysis = self._cache.get(key)
+        if analysis is not None:
+            self._cache.move_to_end(key)
+        return analysis
+
+    def _cache_put(self, key: bytes, analysis: PlanAnalysis) -> None:
+        self._cache[key] = analysis
+        if len(self._cache) > self._CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
 
     async def analyze(self, graph: AssemblyGraph) -> PlanAnalysis:
         """Analyze an assembly plan and return suggestions.
@@ -308,32 +420,40 @@ class AIPlanner:
                 "or pass api_key to AIPlanner."
             )
 
-        try:
-            from anthropic import AsyncAnthropic
-        except ImportError as e:
-            raise PlannerError("anthropic package not installed. Run: pip install anthropic") from e
+        key = self._graph_key(graph)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.info("AI analysis cache hit for %s", graph.id)
+            return cached
 
+        client = self._get_async_client()
         prompt = self._build_prompt(graph)
 
         try:
-            client = AsyncAnthropic(api_key=self._api_key)
             message = await client.messages.create(
                 model=self._model,
                 max_tokens=4096,
-                system=_SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}],
+                system=_SYSTEM_BLOCKS,
+                # Prefilling "{" skips any preamble/fence tokens and forces
+                # the response to continue as raw JSON.
+                messages=[
+                    {"role": "user", "content": prompt},
+                    {"role": "assistant", "content": "{"},
+                ],
             )
         except Exception as e:
             logger.error("Anthropic API call failed: %s", e)
             raise PlannerError(f"AI analysis failed: {e}") from e
 
-        raw_text = message.content[0].text
+        raw_text = "{" + message.content[0].text
         logger.info(
             "AI analysis complete for %s (%d chars response)",
             graph.id,
             len(raw_text),
         )
-        return self._parse_response(raw_text)
+        analysis = self._parse_response(raw_text)
+        self._cache_put(key, analysis)
+        return analysis
 
     def analyze_sync(self, graph: AssemblyGraph) -> PlanAnalysis:
         """Synchronous version of analyze() for use in thread pools.
@@ -357,32 +477,108 @@ class AIPlanner:
                 "or pass api_key to AIPlanner."
             )
 
-        try:
-            from anthropic import Anthropic
-        except ImportError as e:
-            raise PlannerError("anthropic package not installed. Run: pip install anthropic") from e
+        key = self._graph_key(graph)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.info("AI analysis cache hit for %s", graph.id)
+            return cached
 
+        client = self._get_sync_client()
         prompt = self._build_prompt(graph)
 
         try:
-            client = Anthropic(api_key=self._api_key)
             message = client.messages.create(
                 model=self._model,
                 max_tokens=4096,
-                system=_SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}],
+                system=_SYSTEM_BLOCKS,
+                # Same "{" prefill as analyze() — see comment there.
+                messages=[
+                    {"role": "user", "content": prompt},
+                    {"role": "assistant", "content": "{"},
+                ],
             )
         except Exception as e:
             logger.error("Anthropic API call failed: %s", e)
             raise PlannerError(f"AI analysis failed: {e}") from e
 
-        raw_text = message.content[0].text
+        raw_text = "{" + message.content[0].text
         logger.info(
             "AI sync analysis complete for %s (%d chars response)",
             graph.id,
             len(raw_text),
         )
-        return self._parse_response(raw_text)
+        analysis = self._parse_response(raw_text)
+        self._cache_put(key, analysis)
+        return analysis
+
+    async def analyze_batch(self, graphs: list[AssemblyGraph]) -> list[PlanAnalysis]:
+        """Analyze several assembly plans in one Claude call.
+
+        Amortizes the per-call network and inference overhead when multiple
+        assemblies need review (e.g. after a bulk re-upload).
+
+        Args:
+            graphs: Assembly graphs to analyze, in order.
+
+        Returns:
+            One PlanAnalysis per graph, in the same order.
+
+        Raises:
+            PlannerError: If the API key is missing, API call fails, or the
+                response cannot be parsed into one analysis per graph.
+        """
+        if not graphs:
+            return []
+        if len(graphs) == 1:
+            return [await self.analyze(graphs[0])]
+
+        if not self._api_key:
+            raise PlannerError(
+                "ANTHROPIC_API_KEY not set. Configure it in the environment "
+                "or pass api_key to AIPlanner."
+            )
+
+        sections = [
+            f"# Assembly {i + 1}: {g.id}\n\n{self._build_prompt(g)}" for i, g in enumerate(graphs)
+        ]
+        prompt = (
+            f"Analyze the following {len(graphs)} robotic assembly plans. "
+            "Each is delimited by a '# Assembly N' header and ends with its own "
+            "response-format instructions; ignore the per-assembly instruction to "
+            "respond with a single JSON object. Instead respond with ONLY a JSON "
+            "array containing one such object per assembly, in order.\n\n" + "\n\n".join(sections)
+        )
+
+        client = self._get_async_client()
+        try:
+            message = await client.messages.create(
+                model=self._model,
+                max_tokens=4096 * len(graphs),
+                system=_SYSTEM_BLOCKS,
+                # "[" prefill — the array counterpart of analyze()'s "{".
+                messages=[
+                    {"role": "user", "content": prompt},
+                    {"role": "assistant", "content": "["},
+                ],
+            )
+        except Exception as e:
+            logger.error("Anthropic API call failed: %s", e)
+            raise PlannerError(f"AI batch analysis failed: {e}") from e
+
+        raw_text = "[" + message.content[0].text
+        try:
+            wires = _BATCH_WIRE.validate_json(raw_text)
+        except ValidationError as e:
+            logger.error("Failed to parse AI batch response: %s\nRaw: %.500s", e, raw_text)
+            raise PlannerError("AI returned invalid JSON response") from e
+
+        if len(wires) != len(graphs):
+            raise PlannerError(
+                f"AI batch analysis returned {len(wires)} results for {len(graphs)} graphs"
+            )
+
+        logger.info("AI batch analysis complete for %d graphs", len(graphs))
+        return [self._wire_to_analysis(w) for w in wires]
 
     def _build_prompt(self, graph: AssemblyGraph) -> str:
         """Build the analysis prompt with spatial summary and parameter templates."""
@@ -459,27 +655,32 @@ Focus on:
         if text.endswith("```"):
             text = text[:-3].rstrip()
 
+        # Single pydantic-core pass: parse + validate + clamp, with no
+        # intermediate dict to walk.
         try:
-            data = json.loads(text)
-        except json.JSONDecodeError as e:
+            wire = _PlanAnalysisWire.model_validate_json(text)
+        except ValidationError as e:
             logger.error("Failed to parse AI response: %s\nRaw: %.500s", e, raw_text)
             raise PlannerError("AI returned invalid JSON response") from e
 
-        suggestions = [
-            PlanSuggestion(
-                step_id=s.get("stepId", ""),
-                field=s.get("field", ""),
-                old_value=s.get("oldValue"),
-                new_value=s.get("newValue"),
-                reason=s.get("reason", ""),
-            )
-            for s in data.get("suggestions", [])
-        ]
+        return self._wire_to_analysis(wire)
 
+    @staticmethod
+    def _wire_to_analysis(wire: _PlanAnalysisWire) -> PlanAnalysis:
+        """Map a validated wire model onto the public dataclasses."""
         return PlanAnalysis(
-            suggestions=suggestions,
-            warnings=data.get("warnings", []),
-            difficulty_score=max(1, min(10, int(data.get("difficultyScore", 5)))),
-            estimated_teaching_minutes=max(0, int(data.get("estimatedTeachingMinutes", 0))),
-            summary=data.get("summary", ""),
+            suggestions=[
+                PlanSuggestion(
+                    step_id=s.step_id,
+                    field=s.field,
+                    old_value=s.old_value,
+                    new_value=s.new_value,
+                    reason=s.reason,
+                )
+                for s in wire.suggestions
+            ],
+            warnings=wire.warnings,
+            difficulty_score=wire.difficulty_score,
+            estimated_teaching_minutes=wire.estimated_teaching_minutes,
+            summary=wire.summary,
         )
@@ -11,11 +11,14 @@ Override file location: configs/overrides/{assembly_id}.json
 from __future__ import annotations
 
 import datetime
-import json
 import logging
+import os
+from collections import defaultdict
+from collections.abc import Iterable
+from functools import cached_property
 from pathlib import Path
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 from nextis.assembly.models import AssemblyGraph, AssemblyStep, SuccessCriteria
 
@@ -61,6 +64,17 @@ class StepOverride(BaseModel):
     source: str = "user"
     created_at: str = Field(default="", alias="createdAt")
 
+    @field_validator("match_part_ids")
+    @classmethod
+    def _sort_parts(cls, v: list[str]) -> list[str]:
+        """Normalize part IDs to sorted order so duplicate keys compare directly."""
+        return sorted(v)
+
+    @cached_property
+    def pattern_lower(self) -> str:
+        """Case-folded match_pattern, computed once per override ("" when unset)."""
+        return (self.match_pattern or "").lower()
+
 
 class AssemblyOverrides(BaseModel):
     """Collection of overrides for an assembly.
@@ -81,10 +95,18 @@ class AssemblyOverrides(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+# Parsed overrides keyed by file path with mtime validation. Module-level so
+# the cache survives the short-lived OverrideStore instances the routes create,
+# and repeated captures skip the read + parse + validate round-trip.
+_load_cache: dict[Path, tuple[int, AssemblyOverrides]] = {}
+
+
 class OverrideStore:
     """Filesystem-backed override persistence.
 
     One JSON file per assembly at ``{base_dir}/{assembly_id}.json``.
+    Parsed files are cached by mtime, so back-to-back captures from the UI
+    re-read the file only when something else changed it.
 
     Args:
         base_dir: Directory for override JSON files.
@@ -98,13 +120,23 @@ class OverrideStore:
     # -- persistence --------------------------------------------------------
 
     def save(self, overrides: AssemblyOverrides) -> None:
-        """Save overrides to disk.
+        """Save overrides to disk atomically.
+
+        Writes to a temp file and renames it over the target, so a crash
+        mid-write leaves the previous file intact instead of a truncated one.
 
         Args:
             overrides: The overrides collection to persist.
         """
         path = self._dir / f"{overrides.assembly_id}.json"
-        path.write_text(overrides.model_dump_json(by_alias=True, indent=2) + "\n")
+        tmp = path.with_suffix(".json.tmp")
+        with tmp.open("wb") as f:
+            f.write(overrides.model_dump_json(by_alias=True, indent=2).encode() + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        # Atomic swap — readers see either the old file or the new one.
+        os.replace(tmp, path)
+        _load_cache[path] = (path.stat().st_mtime_ns, overrides)
         logger.debug("Saved %d overrides for %s", len(overrides.overrides), overrides.assembly_id)
 
     def load(self, assembly_id: str) -> AssemblyOverrides | None:
@@ -117,15 +149,26 @@ class OverrideStore:
             Parsed overrides, or None if no file exists.
         """
         path = self._dir / f"{assembly_id}.json"
-        if not path.exists():
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            _load_cache.pop(path, None)
             return None
+
+        cached = _load_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
-            data = json.loads(path.read_text())
-            return AssemblyOverrides.model_validate(data)
-        except (json.JSONDecodeError, Exception):
+            # Single-pass parse + validate on pydantic's compiled core schema.
+            overrides = AssemblyOverrides.model_validate_json(path.read_bytes())
+        except ValidationError:
             logger.warning("Corrupt override file %s, ignoring", path, exc_info=True)
             return None
 
+        _load_cache[path] = (mtime_ns, overrides)
+        return overrides
+
     def delete(self, assembly_id: str) -> bool:
         """Delete all overrides for an assembly.
 
@@ -136,6 +179,7 @@ class OverrideStore:
             True if the file existed and was deleted.
         """
         path = self._dir / f"{assembly_id}.json"
+        _load_cache.pop(path, None)
         if path.exists():
             path.unlink()
             logger.info("Deleted overrides for %s", assembly_id)
@@ -149,6 +193,7 @@ class OverrideStore:
         assembly_id: str,
         step: AssemblyStep,
         source: str = "user",
+        timestamp: str | None = None,
     ) -> None:
         """Capture a single step's current state as a persistent override.
 
@@ -159,6 +204,9 @@ class OverrideStore:
             assembly_id: Assembly this step belongs to.
             step: The step whose settings to capture.
             source: Who created this override — ``"user"`` or ``"ai"``.
+            timestamp: ISO ``created_at`` to stamp the override with. Batch
+                callers pass one shared value instead of formatting a fresh
+                timestamp per capture; defaults to now.
         """
         existing = self.load(assembly_id)
         overrides_list = existing.overrides if existing else []
@@ -173,10 +221,12 @@ class OverrideStore:
             success_criteria=step.success_criteria.model_dump(by_alias=True),
             max_retries=step.max_retries,
             source=source,
-            created_at=datetime.datetime.now(datetime.UTC).isoformat(),
+            created_at=timestamp or _now_iso(),
         )
 
-        _upsert(overrides_list, new_override)
+        if not _upsert(overrides_list, new_override):
+            logger.debug("Override for step %s unchanged, skipping save", step.id)
+            return
         result = AssemblyOverrides(assembly_id=assembly_id, overrides=overrides_list)
         self.save(result)
 
@@ -212,12 +262,42 @@ class OverrideStore:
             key=lambda o: 0 if o.source == "ai" else 1,
         )
 
+        # Precompute each step's match keys once instead of re-lowercasing
+        # names and rebuilding part-id sets for every override x step pair.
+        steps = list(graph.steps.values())
+        step_names = [s.name.lower() for s in steps]
+        step_parts = [frozenset(s.part_ids) for s in steps]
+
+        # Reverse index so part-keyed overrides jump straight to candidates.
+        # Skipped entirely for pattern-only override sets.
+        steps_by_part: dict[str, list[int]] = defaultdict(list)
+        if any(o.match_part_ids for o in sorted_overrides):
+            for i, parts in enumerate(step_parts):
+                for pid in parts:
+                    steps_by_part[pid].append(i)
+
         modified: set[str] = set()
         for override in sorted_overrides:
-            for step in graph.steps.values():
-                if _matches(override, step):
-                    _apply_override(step, override)
-                    modified.add(step.id)
+            pattern = override.pattern_lower
+            ov_parts = override.match_part_ids
+            # An empty-string pattern matches every step (baseline semantics);
+            # only a truly unset matcher — None pattern, no parts — is skipped.
+            if override.match_pattern is None and not ov_parts:
+                continue
+
+            if ov_parts:
+                candidates: Iterable[int] = sorted(
+                    {i for pid in ov_parts for i in steps_by_part.get(pid, ())}
+                )
+            else:
+                candidates = range(len(steps))
+
+            # Filter once, so the apply loop carries no per-step branching.
+            if pattern:
+                candidates = [i for i in candidates if pattern in step_names[i]]
+            for i in candidates:
+                _apply_override(steps[i], override)
+                modified.add(steps[i].id)
 
         return len(modified)
 
@@ -227,30 +307,10 @@ class OverrideStore:
 # ---------------------------------------------------------------------------
 
 
-def _matches(override: StepOverride, step: AssemblyStep) -> bool:
-    """Check whether an override matches a step.
-
-    Args:
-        override: The override with matching criteria.
-        step: The step to test.
-
-    Returns:
-        True if the override should be applied to this step.
-    """
-    has_pattern = override.match_pattern is not None
-    has_parts = bool(override.match_part_ids)
-
-    if not has_pattern and not has_parts:
-        return False
-
-    pattern_ok = override.match_pattern.lower() in step.name.lower() if has_pattern else True
-    parts_ok = bool(set(override.match_part_ids) & set(step.part_ids)) if has_parts else True
-
-    if has_pattern and has_parts:
-        return pattern_ok and parts_ok
-    if has_pattern:
-        return pattern_ok
-    return parts_ok
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601. Millisecond precision is enough for
+    ``created_at`` and formats faster than the microsecond default."""
+    return datetime.datetime.now(datetime.UTC).isoformat(timespec="milliseconds")
 
 
 def _apply_override(step: AssemblyStep, override: StepOverride) -> None:
@@ -277,22 +337,30 @@ def _apply_override(step: AssemblyStep, override: StepOverride) -> None:
         step.policy_id = override.policy_id
 
 
-def _upsert(overrides: list[StepOverride], new: StepOverride) -> None:
+def _upsert(overrides: list[StepOverride], new: StepOverride) -> bool:
     """Insert or update an override in a list, preventing duplicates.
 
     Two overrides are considered duplicates if they have the same
-    ``match_pattern`` and ``match_part_ids`` (sorted for comparison).
+    ``match_pattern`` and ``match_part_ids`` (normalized to sorted order
+    at construction, so plain equality suffices).
 
     Args:
         overrides: Mutable list to update.
         new: Override to insert or replace.
+
+    Returns:
+        True if the list changed; False when the matching existing override
+        already carries the same values (ignoring ``created_at``).
     """
-    new_parts = sorted(new.match_part_ids)
     for i, existing in enumerate(overrides):
         if (
             existing.match_pattern == new.match_pattern
-            and sorted(existing.match_part_ids) == new_parts
+            and existing.match_part_ids == new.match_part_ids
         ):
+            exclude = {"created_at"}
+            if existing.model_dump(exclude=exclude) == new.model_dump(exclude=exclude):
+                return False
             overrides[i] = new
-            return
+            return True
     overrides.append(new)
+    return True
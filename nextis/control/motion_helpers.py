@@ -10,9 +10,34 @@ which in turn needs PrimitiveResult.
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
+# Canonical joint ordering matching MockRobot / Damiao arm layout
+JOINT_ORDER: list[str] = [
+    "base",
+    "link1",
+    "link2",
+    "link3",
+    "link4",
+    "link5",
+    "gripper",
+]
+JOINT_COUNT: int = len(JOINT_ORDER)
+
+# Observation/action keys, formatted once — the 60 Hz loops look these up
+# thousands of times per second and should not re-run f-string formatting.
+_POS_KEYS: tuple[str, ...] = tuple(f"{name}.pos" for name in JOINT_ORDER)
+
+
+def _empty_history() -> np.ndarray:
+    return np.empty((0, JOINT_COUNT), dtype=np.float32)
+
 
 @dataclass
 class PrimitiveResult:
@@ -24,8 +49,8 @@ class PrimitiveResult:
         actual_position: Joint positions at completion.
         duration_ms: Execution time in milliseconds.
         error_message: Description of failure, if any.
-        force_history: Per-tick joint torques captured during execution.
-            Each entry is a list of torques in JOINT_ORDER.
+        force_history: Per-tick joint torques captured during execution,
+            as a ``(ticks, JOINT_COUNT)`` float32 array in JOINT_ORDER.
     """
 
     success: bool
@@ -33,20 +58,62 @@ class PrimitiveResult:
     actual_position: list[float] = field(default_factory=list)
     duration_ms: float = 0.0
     error_message: str | None = None
-    force_history: list[list[float]] = field(default_factory=list)
+    force_history: np.ndarray = field(default_factory=_empty_history)
 
 
-# Canonical joint ordering matching MockRobot / Damiao arm layout
-JOINT_ORDER: list[str] = [
-    "base",
-    "link1",
-    "link2",
-    "link3",
-    "link4",
-    "link5",
-    "gripper",
-]
-JOINT_COUNT: int = len(JOINT_ORDER)
+class ForceTrace:
+    """Growable ``(ticks, JOINT_COUNT)`` float32 buffer for per-tick torques.
+
+    Preallocates rows and doubles capacity when full, so the 60 Hz control
+    loops append torque readings without per-tick list allocations.
+    """
+
+    __slots__ = ("_buf", "_len")
+
+    _INITIAL_ROWS = 256  # ~4s of history at CONTROL_HZ
+
+    def __init__(self, initial_rows: int | None = None) -> None:
+        self._buf = np.empty((initial_rows or self._INITIAL_ROWS, JOINT_COUNT), dtype=np.float32)
+        self._len = 0
+
+    @classmethod
+    def for_duration(cls, seconds: float) -> ForceTrace:
+        """Build a trace sized to hold *seconds* of ticks without growing.
+
+        Args:
+            seconds: Expected capture duration (typically the primitive timeout).
+
+        Returns:
+            A trace preallocated for the full run, with a little headroom.
+        """
+        return cls(int(seconds * CONTROL_HZ) + 8)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, row: np.ndarray) -> None:
+        """Append one torque reading, growing the buffer if needed."""
+        if self._len == len(self._buf):
+            grown = np.empty((len(self._buf) * 2, JOINT_COUNT), dtype=np.float32)
+            grown[: self._len] = self._buf
+            self._buf = grown
+        self._buf[self._len] = row
+        self._len += 1
+
+    def extend(self, rows: np.ndarray) -> None:
+        """Append a block of torque readings (e.g. a prior phase's history)."""
+        for row in rows:
+            self.append(row)
+
+    @property
+    def last(self) -> np.ndarray:
+        """View of the most recent reading. Buffer must be non-empty."""
+        return self._buf[self._len - 1]
+
+    def asarray(self) -> np.ndarray:
+        """Return the filled portion of the buffer as a ``(ticks, 7)`` view."""
+        return self._buf[: self._len]
+
 
 # Gripper position bounds (unitless, matches mock calibration range)
 GRIPPER_CLOSED: float = 1.0
@@ -55,50 +122,208 @@ GRIPPER_OPEN: float = 0.0
 # Control loop rate for primitives (Hz)
 CONTROL_HZ: int = 60
 CONTROL_DT: float = 1.0 / CONTROL_HZ
+CONTROL_DT_NS: int = 1_000_000_000 // CONTROL_HZ
+
+
+def elapsed_ms(start_ns: int) -> float:
+    """Milliseconds elapsed since a ``time.perf_counter_ns()`` reference."""
+    return (time.perf_counter_ns() - start_ns) * 1e-6
+
+
+async def sleep_until(deadline_ns: int) -> None:
+    """Sleep until *deadline_ns* on the perf-counter clock.
+
+    Unlike a fixed ``asyncio.sleep(CONTROL_DT)``, this subtracts the compute
+    time already spent this tick, so a loop stepping absolute deadlines holds
+    its nominal rate instead of drifting by per-tick overhead. When the
+    deadline has already passed, yields once anyway so an overrunning loop
+    cannot starve the event loop.
+
+    Args:
+        deadline_ns: Absolute ``time.perf_counter_ns()`` value to wake at.
+    """
+    remaining = deadline_ns - time.perf_counter_ns()
+    await asyncio.sleep(remaining * 1e-9 if remaining > 0 else 0)
+
+
+async def tick_loop(start_ns: int, timeout_ns: int) -> AsyncIterator[int]:
+    """Yield tick indices at CONTROL_HZ until *timeout_ns* elapses.
+
+    Factors out the skeleton shared by every primitive control loop: the
+    timeout check and the drift-corrected deadline sleep between ticks.
+    The loop body runs between yields; overruns are absorbed by stepping
+    absolute deadlines from *start_ns*. Timing is integer nanoseconds
+    throughout — one int compare per tick, no float rounding over long runs.
+
+    Args:
+        start_ns: ``time.perf_counter_ns()`` the loop began (deadline anchor).
+        timeout_ns: Maximum loop duration in ns, measured from *start_ns*.
+
+    Yields:
+        The current tick index, starting at 0.
+    """
+    tick = 0
+    while time.perf_counter_ns() - start_ns < timeout_ns:
+        yield tick
+        tick += 1
+        await sleep_until(start_ns + tick * CONTROL_DT_NS)
 
 
-def obs_to_joints(obs: dict[str, float]) -> list[float]:
+def obs_to_joints(obs: dict[str, float]) -> np.ndarray:
     """Extract joint positions from observation dict in JOINT_ORDER.
 
     Args:
         obs: Robot observation dict with ``{name}.pos`` keys.
 
     Returns:
-        List of joint positions in canonical order.
+        Float32 array of joint positions in canonical order.
     """
-    return [obs.get(f"{name}.pos", 0.0) for name in JOINT_ORDER]
+    return np.fromiter(
+        (obs.get(k, 0.0) for k in _POS_KEYS),
+        dtype=np.float32,
+        count=JOINT_COUNT,
+    )
 
 
-def joints_to_action(values: list[float]) -> dict[str, float]:
-    """Build an action dict from a joint position list.
+def joints_to_action(values: np.ndarray | list[float]) -> dict[str, float]:
+    """Build an action dict from a joint position vector.
 
     Args:
         values: Joint positions in canonical order.
 
     Returns:
-        Action dict with ``{name}.pos`` keys.
+        Action dict with ``{name}.pos`` keys and plain-float values.
     """
-    return {f"{name}.pos": val for name, val in zip(JOINT_ORDER, values, strict=False)}
+    if isinstance(values, np.ndarray):
+        # One C-level conversion to Python floats instead of 7 float() calls.
+        return dict(zip(_POS_KEYS, values.tolist(), strict=False))
+    return {k: float(val) for k, val in zip(_POS_KEYS, values, strict=False)}
 
 
-def read_torques_list(robot: Any) -> list[float]:
+def joints_to_action_into(values: np.ndarray, out: dict[str, float]) -> dict[str, float]:
+    """Fill a reusable action dict from a joint vector, in place.
+
+    Tick loops that send a fresh command every tick can hold one action dict
+    and overwrite its values instead of allocating a new dict per tick. The
+    robot must not retain the dict across calls (MockRobot copies it).
+
+    Args:
+        values: Joint positions in canonical order.
+        out: Action dict to update (keys are filled on first use).
+
+    Returns:
+        The *out* dict, for passing directly to ``send_action``.
+    """
+    for k, v in zip(_POS_KEYS, values.tolist(), strict=False):
+        out[k] = v
+    return out
+
+
+def read_torques_list(robot: Any) -> np.ndarray:
     """Read joint torques from robot in canonical order.
 
     Args:
         robot: Connected robot instance with ``get_torques()``.
 
     Returns:
-        List of torque values in JOINT_ORDER.
+        Float32 array of torque values in JOINT_ORDER.
+    """
+    torques = robot.get_torques()
+    return np.fromiter(
+        (torques.get(name, 0.0) for name in JOINT_ORDER),
+        dtype=np.float32,
+        count=JOINT_COUNT,
+    )
+
+
+def obs_to_joints_into(obs: dict[str, float], out: np.ndarray) -> np.ndarray:
+    """Fill *out* with joint positions from an observation dict.
+
+    Allocation-free variant of :func:`obs_to_joints` for tick loops that
+    reuse one scratch array across iterations.
+
+    Args:
+        obs: Robot observation dict with ``{name}.pos`` keys.
+        out: Array of JOINT_COUNT entries to fill.
+
+    Returns:
+        The *out* array.
+    """
+    for i, k in enumerate(_POS_KEYS):
+        out[i] = obs.get(k, 0.0)
+    return out
+
+
+def read_torques_into(robot: Any, out: np.ndarray) -> np.ndarray:
+    """Read joint torques into a caller-held scratch array.
+
+    Args:
+        robot: Connected robot instance with ``get_torques()``.
+        out: Array of JOINT_COUNT entries to fill.
+
+    Returns:
+        The *out* array.
     """
     torques = robot.get_torques()
-    return [torques.get(name, 0.0) for name in JOINT_ORDER]
+    for i, name in enumerate(JOINT_ORDER):
+        out[i] = torques.get(name, 0.0)
+    return out
+
+
+def read_state_into(
+    robot: Any,
+    pos_out: np.ndarray,
+    torque_out: np.ndarray,
+) -> None:
+    """Allocation-free :func:`read_state` for tick loops with scratch buffers.
+
+    Args:
+        robot: Connected robot instance.
+        pos_out: Scratch array for joint positions (JOINT_COUNT entries).
+        torque_out: Scratch array for torques (JOINT_COUNT entries).
+    """
+    get_state = getattr(robot, "get_state", None)
+    if get_state is not None:
+        obs, torques = get_state()
+    else:
+        obs = robot.get_observation()
+        torques = robot.get_torques()
+    obs_to_joints_into(obs, pos_out)
+    for i, name in enumerate(JOINT_ORDER):
+        torque_out[i] = torques.get(name, 0.0)
+
+
+def read_state(robot: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Read joint positions and torques together.
+
+    Robots exposing ``get_state()`` (one bus transaction for both, e.g. a
+    Damiao bulk read) serve the pair from a single call; otherwise this
+    falls back to separate observation and torque reads.
+
+    Args:
+        robot: Connected robot instance.
+
+    Returns:
+        Tuple of (positions, torques) float32 arrays in JOINT_ORDER.
+    """
+    get_state = getattr(robot, "get_state", None)
+    if get_state is not None:
+        obs, torques = get_state()
+    else:
+        obs = robot.get_observation()
+        torques = robot.get_torques()
+    return obs_to_joints(obs), np.fromiter(
+        (torques.get(name, 0.0) for name in JOINT_ORDER),
+        dtype=np.float32,
+        count=JOINT_COUNT,
+    )
 
 
 def interpolate_step(
-    current: list[float],
-    target: list[float],
+    current: np.ndarray,
+    target: np.ndarray,
     alpha: float,
-) -> list[float]:
+) -> np.ndarray:
     """Linearly interpolate each joint from *current* toward *target*.
 
     Args:
@@ -110,11 +335,33 @@ def interpolate_step(
         Interpolated joint positions.
     """
     alpha = max(0.0, min(1.0, alpha))
-    return [c + alpha * (t - c) for c, t in zip(current, target, strict=False)]
+    return current + alpha * (target - current)
+
+
+def interpolate_many(
+    current: np.ndarray,
+    target: np.ndarray,
+    alphas: np.ndarray,
+) -> np.ndarray:
+    """Interpolate a whole trajectory in one broadcast.
 
+    Lets primitives that pre-plan a ramp compute every waypoint up front
+    instead of interpolating per tick.
 
-def pad_target(target: list[float], current: list[float]) -> list[float]:
-    """Pad a short target list with current positions to reach JOINT_COUNT.
+    Args:
+        current: Current joint positions, shape ``(JOINT_COUNT,)``.
+        target: Target joint positions, shape ``(JOINT_COUNT,)``.
+        alphas: Interpolation factors, shape ``(T,)``.
+
+    Returns:
+        Waypoints of shape ``(T, JOINT_COUNT)``.
+    """
+    alphas = np.clip(alphas, 0.0, 1.0)[:, np.newaxis]
+    return current + alphas * (target - current)
+
+
+def pad_target(target: list[float] | np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Pad a short target vector with current positions to reach JOINT_COUNT.
 
     If *target* has fewer entries than JOINT_COUNT, remaining joints hold
     their current positions.
@@ -126,14 +373,15 @@ def pad_target(target: list[float], current: list[float]) -> list[float]:
     Returns:
         Padded target with exactly JOINT_COUNT entries.
     """
-    if len(target) >= JOINT_COUNT:
-        return target[:JOINT_COUNT]
-    return target + current[len(target) :]
+    out = current.astype(np.float32, copy=True)
+    n = min(len(target), JOINT_COUNT)
+    out[:n] = target[:n]
+    return out
 
 
 def position_reached(
-    current: list[float],
-    target: list[float],
+    current: np.ndarray,
+    target: np.ndarray,
     tolerance: float = 0.02,
 ) -> bool:
     """Check if all joints are within tolerance of target.
@@ -146,18 +394,38 @@ def position_reached(
     Returns:
         True if every joint is within tolerance.
     """
-    return all(abs(c - t) < tolerance for c, t in zip(current, target, strict=False))
+    return bool(np.all(np.abs(current - target) < tolerance))
+
+
+def contact_metrics(
+    torques: np.ndarray,
+    current: np.ndarray,
+    origin: np.ndarray,
+) -> tuple[float, float]:
+    """Per-tick reductions for contact-driven moves, fused into one call.
+
+    Args:
+        torques: Current joint torques in JOINT_ORDER.
+        current: Current joint positions.
+        origin: Joint positions at primitive start.
+
+    Returns:
+        Tuple of (peak arm torque excluding the gripper, L2 displacement
+        from origin).
+    """
+    diff = current - origin
+    return float(np.abs(torques[:6]).max()), float(np.sqrt(np.dot(diff, diff)))
 
 
-def peak_abs_torque(torques: list[float]) -> float:
+def peak_abs_torque(torques: np.ndarray) -> float:
     """Return the maximum absolute torque from a reading.
 
     Args:
-        torques: List of torque values.
+        torques: Array of torque values.
 
     Returns:
         Maximum absolute value, or 0.0 if empty.
     """
-    if not torques:
+    if torques.size == 0:
         return 0.0
-    return max(abs(t) for t in torques)
+    return float(np.abs(torques).max())
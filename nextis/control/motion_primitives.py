@@ -6,27 +6,41 @@ Each primitive has a dual path:
 
 All primitives record ``force_history`` (per-tick joint torques) and return
 real sensor data in :class:`PrimitiveResult`.
+
+Each tick sends exactly one setpoint and it must be on the wire before the
+tick sleep — never queue or coalesce actions across ticks, since a deferred
+command would be acted on a tick late and skew the force readings taken
+against it.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import time
 from typing import Any
 
+import numpy as np
+
 from nextis.control.motion_helpers import (
     CONTROL_DT,
     GRIPPER_CLOSED,
     GRIPPER_OPEN,
+    JOINT_COUNT,
+    ForceTrace,
     PrimitiveResult,
-    interpolate_step,
+    contact_metrics,
+    elapsed_ms,
     joints_to_action,
+    joints_to_action_into,
     obs_to_joints,
     pad_target,
     peak_abs_torque,
     position_reached,
-    read_torques_list,
+    read_state_into,
+    read_torques_into,
+    tick_loop,
 )
 
 logger = logging.getLogger(__name__)
@@ -57,52 +71,54 @@ async def move_to(
     """
     speed = kwargs.pop("_speed_factor", 1.0)
     target_pose = target_pose or []
-    logger.info("move_to: target=%s velocity=%.2f", target_pose, velocity)
-    start = time.monotonic()
+    logger.debug("move_to: target=%s velocity=%.2f", target_pose, velocity)
+    start_ns = time.perf_counter_ns()
+    timeout_ns = int(timeout * 1e9)
 
     # Mock path
     if robot is None:
         await asyncio.sleep(min(1.0, timeout) * speed)
-        duration = (time.monotonic() - start) * 1000
-        logger.info("move_to: complete in %.0fms (mock)", duration)
+        duration = elapsed_ms(start_ns)
+        logger.debug("move_to: complete in %.0fms (mock)", duration)
         return PrimitiveResult(success=True, actual_position=target_pose, duration_ms=duration)
 
     # Real path
     current = obs_to_joints(robot.get_observation())
     target = pad_target(target_pose, current)
-    forces: list[list[float]] = []
+    forces = ForceTrace.for_duration(timeout)
+    alpha = min(1.0, velocity * CONTROL_DT * 2.0)  # loop-invariant
+    action: dict[str, float] = {}
+    torques = np.empty(JOINT_COUNT, dtype=np.float32)
 
-    while (time.monotonic() - start) < timeout:
-        current = obs_to_joints(robot.get_observation())
-        torques = read_torques_list(robot)
+    async for _tick in tick_loop(start_ns, timeout_ns):
+        read_state_into(robot, current, torques)
         forces.append(torques)
 
         if position_reached(current, target):
-            duration = (time.monotonic() - start) * 1000
-            logger.info("move_to: converged in %.0fms", duration)
+            duration = elapsed_ms(start_ns)
+            logger.debug("move_to: converged in %.0fms", duration)
             return PrimitiveResult(
                 success=True,
-                actual_position=current,
+                actual_position=current.tolist(),
                 actual_force=peak_abs_torque(torques),
                 duration_ms=duration,
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
-        alpha = min(1.0, velocity * CONTROL_DT * 2.0)
-        command = interpolate_step(current, target, alpha)
-        robot.send_action(joints_to_action(command))
-        await asyncio.sleep(CONTROL_DT)
+        # Inline lerp — alpha is pre-clamped, no per-tick function call.
+        command = current + alpha * (target - current)
+        robot.send_action(joints_to_action_into(command, action))
 
     # Timeout
-    duration = (time.monotonic() - start) * 1000
+    duration = elapsed_ms(start_ns)
     logger.warning("move_to: timed out after %.0fms", duration)
     return PrimitiveResult(
         success=False,
-        actual_position=current,
-        actual_force=peak_abs_torque(forces[-1]) if forces else 0.0,
+        actual_position=current.tolist(),
+        actual_force=peak_abs_torque(forces.last) if len(forces) else 0.0,
         duration_ms=duration,
         error_message=f"move_to timed out after {timeout:.1f}s",
-        force_history=forces,
+        force_history=forces.asarray(),
     )
 
 
@@ -132,19 +148,20 @@ async def pick(
         PrimitiveResult with measured grip force.
     """
     speed = kwargs.pop("_speed_factor", 1.0)
-    logger.info(
+    logger.debug(
         "pick: grasp_pose=%s approach=%.3fm threshold=%.2fNm",
         grasp_pose,
         approach_height,
         force_threshold,
     )
-    start = time.monotonic()
+    start_ns = time.perf_counter_ns()
+    timeout_ns = int(timeout * 1e9)
 
     # Mock path
     if robot is None:
         await asyncio.sleep(min(1.5, timeout) * speed)
-        duration = (time.monotonic() - start) * 1000
-        logger.info("pick: complete in %.0fms (mock)", duration)
+        duration = elapsed_ms(start_ns)
+        logger.debug("pick: complete in %.0fms (mock)", duration)
         return PrimitiveResult(
             success=True,
             actual_force=force_threshold,
@@ -155,47 +172,50 @@ async def pick(
     # Real path — Phase 1: move to grasp pose
     move_timeout = timeout * 0.6
     move_result = await move_to(robot, target_pose=grasp_pose, velocity=0.5, timeout=move_timeout)
-    forces: list[list[float]] = list(move_result.force_history)
+    forces = ForceTrace.for_duration(timeout)
+    forces.extend(move_result.force_history)
     if not move_result.success:
         move_result.error_message = (
             f"pick: failed to reach grasp pose — {move_result.error_message}"
         )
-        move_result.force_history = forces
         return move_result
 
-    # Phase 2: close gripper until force threshold
+    # Phase 2: close gripper until force threshold. The hold command never
+    # changes inside the loop, so build the action dict once.
     current = obs_to_joints(robot.get_observation())
-    while (time.monotonic() - start) < timeout:
-        torques = read_torques_list(robot)
+    command = current.copy()
+    command[6] = GRIPPER_CLOSED
+    hold_action = joints_to_action(command)
+    phase_start_ns = time.perf_counter_ns()
+    torques = np.empty(JOINT_COUNT, dtype=np.float32)
+    async for _tick in tick_loop(phase_start_ns, timeout_ns - (phase_start_ns - start_ns)):
+        read_torques_into(robot, torques)
         forces.append(torques)
-        gripper_torque = abs(torques[6])  # gripper is last in JOINT_ORDER
+        gripper_torque = float(abs(torques[6]))  # gripper is last in JOINT_ORDER
 
         if gripper_torque >= force_threshold:
-            duration = (time.monotonic() - start) * 1000
-            logger.info("pick: grasped at %.2fNm in %.0fms", gripper_torque, duration)
+            duration = elapsed_ms(start_ns)
+            logger.debug("pick: grasped at %.2fNm in %.0fms", gripper_torque, duration)
             return PrimitiveResult(
                 success=True,
                 actual_force=gripper_torque,
-                actual_position=obs_to_joints(robot.get_observation()),
+                actual_position=current.tolist(),
                 duration_ms=duration,
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
         # Close gripper, hold other joints
-        command = list(current)
-        command[6] = GRIPPER_CLOSED
-        robot.send_action(joints_to_action(command))
-        await asyncio.sleep(CONTROL_DT)
+        robot.send_action(hold_action)
 
-    duration = (time.monotonic() - start) * 1000
+    duration = elapsed_ms(start_ns)
     logger.warning("pick: force threshold not reached in %.0fms", duration)
     return PrimitiveResult(
         success=False,
-        actual_force=abs(read_torques_list(robot)[6]),
-        actual_position=obs_to_joints(robot.get_observation()),
+        actual_force=float(abs(forces.last[6])) if len(forces) else 0.0,
+        actual_position=current.tolist(),
         duration_ms=duration,
         error_message=f"Gripper force below threshold {force_threshold:.2f}Nm",
-        force_history=forces,
+        force_history=forces.asarray(),
     )
 
 
@@ -226,56 +246,60 @@ async def place(
     """
     speed = kwargs.pop("_speed_factor", 1.0)
     target_pose = target_pose or []
-    logger.info("place: target=%s approach=%.3fm", target_pose, approach_height)
-    start = time.monotonic()
+    logger.debug("place: target=%s approach=%.3fm", target_pose, approach_height)
+    start_ns = time.perf_counter_ns()
+    timeout_ns = int(timeout * 1e9)
 
     # Mock path
     if robot is None:
         await asyncio.sleep(min(1.5, timeout) * speed)
-        duration = (time.monotonic() - start) * 1000
-        logger.info("place: complete in %.0fms (mock)", duration)
+        duration = elapsed_ms(start_ns)
+        logger.debug("place: complete in %.0fms (mock)", duration)
         return PrimitiveResult(success=True, actual_position=target_pose, duration_ms=duration)
 
     # Real path — Phase 1: move to placement pose
     move_timeout = timeout * 0.6
     move_result = await move_to(robot, target_pose=target_pose, velocity=0.5, timeout=move_timeout)
-    forces: list[list[float]] = list(move_result.force_history)
+    forces = ForceTrace.for_duration(timeout)
+    forces.extend(move_result.force_history)
     if not move_result.success:
         move_result.error_message = f"place: failed to reach target — {move_result.error_message}"
-        move_result.force_history = forces
         return move_result
 
-    # Phase 2: open gripper
+    # Phase 2: open gripper. The hold command never changes inside the
+    # loop, so build the action dict once.
     current = obs_to_joints(robot.get_observation())
-    while (time.monotonic() - start) < timeout:
-        torques = read_torques_list(robot)
+    command = current.copy()
+    command[6] = GRIPPER_OPEN
+    hold_action = joints_to_action(command)
+    phase_start_ns = time.perf_counter_ns()
+    torques = np.empty(JOINT_COUNT, dtype=np.float32)
+    async for _tick in tick_loop(phase_start_ns, timeout_ns - (phase_start_ns - start_ns)):
+        read_torques_into(robot, torques)
         forces.append(torques)
-        gripper_torque = abs(torques[6])
+        gripper_torque = float(abs(torques[6]))
 
         if gripper_torque <= release_force:
-            duration = (time.monotonic() - start) * 1000
-            logger.info("place: released at %.2fNm in %.0fms", gripper_torque, duration)
+            duration = elapsed_ms(start_ns)
+            logger.debug("place: released at %.2fNm in %.0fms", gripper_torque, duration)
             return PrimitiveResult(
                 success=True,
-                actual_position=obs_to_joints(robot.get_observation()),
+                actual_position=current.tolist(),
                 actual_force=gripper_torque,
                 duration_ms=duration,
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
-        command = list(current)
-        command[6] = GRIPPER_OPEN
-        robot.send_action(joints_to_action(command))
-        await asyncio.sleep(CONTROL_DT)
+        robot.send_action(hold_action)
 
-    duration = (time.monotonic() - start) * 1000
+    duration = elapsed_ms(start_ns)
     logger.warning("place: gripper release not confirmed in %.0fms", duration)
     return PrimitiveResult(
         success=False,
-        actual_position=obs_to_joints(robot.get_observation()),
+        actual_position=current.tolist(),
         duration_ms=duration,
         error_message=f"Gripper force above release threshold {release_force:.2f}Nm",
-        force_history=forces,
+        force_history=forces.asarray(),
     )
 
 
@@ -306,19 +330,20 @@ async def guarded_move(
     """
     speed = kwargs.pop("_speed_factor", 1.0)
     direction = direction or [0, 0, -1]
-    logger.info(
+    logger.debug(
         "guarded_move: dir=%s threshold=%.1fNm max=%.3f",
         direction,
         force_threshold,
         max_distance,
     )
-    start = time.monotonic()
+    start_ns = time.perf_counter_ns()
+    timeout_ns = int(timeout * 1e9)
 
     # Mock path
     if robot is None:
         await asyncio.sleep(min(1.0, timeout) * speed)
-        duration = (time.monotonic() - start) * 1000
-        logger.info("guarded_move: contact at %.1fNm in %.0fms (mock)", force_threshold, duration)
+        duration = elapsed_ms(start_ns)
+        logger.debug("guarded_move: contact at %.1fNm in %.0fms (mock)", force_threshold, duration)
         return PrimitiveResult(
             success=True,
             actual_force=force_threshold,
@@ -327,57 +352,58 @@ async def guarded_move(
 
     # Real path — step along direction until force contact
     current = obs_to_joints(robot.get_observation())
-    origin = list(current)
-    forces: list[list[float]] = []
+    origin = current.copy()
+    forces = ForceTrace.for_duration(timeout)
     # Normalize direction to 7 joints (pad with zeros for gripper)
-    dir_padded = list(direction) + [0.0] * max(0, 7 - len(direction))
+    dir_padded = np.zeros(JOINT_COUNT, dtype=np.float32)
+    dir_padded[: min(len(direction), JOINT_COUNT)] = direction[:JOINT_COUNT]
     step_size = CONTROL_DT * 0.5  # joint displacement per tick
+    step_vec = dir_padded * np.float32(step_size)  # per-tick displacement, loop-invariant
+    action: dict[str, float] = {}
+    torques = np.empty(JOINT_COUNT, dtype=np.float32)
 
-    while (time.monotonic() - start) < timeout:
-        current = obs_to_joints(robot.get_observation())
-        torques = read_torques_list(robot)
+    async for _tick in tick_loop(start_ns, timeout_ns):
+        read_state_into(robot, current, torques)
         forces.append(torques)
+        peak, displacement = contact_metrics(torques, current, origin)
 
         # Check force threshold (peak across non-gripper joints)
-        peak = peak_abs_torque(torques[:6])
         if peak >= force_threshold:
-            duration = (time.monotonic() - start) * 1000
-            logger.info("guarded_move: contact at %.2fNm in %.0fms", peak, duration)
+            duration = elapsed_ms(start_ns)
+            logger.debug("guarded_move: contact at %.2fNm in %.0fms", peak, duration)
             return PrimitiveResult(
                 success=True,
                 actual_force=peak,
-                actual_position=current,
+                actual_position=current.tolist(),
                 duration_ms=duration,
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
         # Check max distance
-        displacement = sum((c - o) ** 2 for c, o in zip(current, origin, strict=False)) ** 0.5
         if displacement >= max_distance:
-            duration = (time.monotonic() - start) * 1000
-            logger.info("guarded_move: max distance reached without contact")
+            duration = elapsed_ms(start_ns)
+            logger.debug("guarded_move: max distance reached without contact")
             return PrimitiveResult(
                 success=False,
                 actual_force=peak,
-                actual_position=current,
+                actual_position=current.tolist(),
                 duration_ms=duration,
                 error_message=f"Max distance {max_distance:.3f} reached without force contact",
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
         # Step in direction
-        command = [c + d * step_size for c, d in zip(current, dir_padded, strict=False)]
-        robot.send_action(joints_to_action(command))
-        await asyncio.sleep(CONTROL_DT)
+        command = current + step_vec
+        robot.send_action(joints_to_action_into(command, action))
 
-    duration = (time.monotonic() - start) * 1000
+    duration = elapsed_ms(start_ns)
     logger.warning("guarded_move: timed out after %.0fms", duration)
     return PrimitiveResult(
         success=False,
-        actual_position=current,
+        actual_position=current.tolist(),
         duration_ms=duration,
         error_message=f"guarded_move timed out after {timeout:.1f}s",
-        force_history=forces,
+        force_history=forces.asarray(),
     )
 
 
@@ -408,14 +434,15 @@ async def linear_insert(
     """
     speed = kwargs.pop("_speed_factor", 1.0)
     target_pose = target_pose or []
-    logger.info("linear_insert: target=%s force_limit=%.1fNm", target_pose, force_limit)
-    start = time.monotonic()
+    logger.debug("linear_insert: target=%s force_limit=%.1fNm", target_pose, force_limit)
+    start_ns = time.perf_counter_ns()
+    timeout_ns = int(timeout * 1e9)
 
     # Mock path
     if robot is None:
         await asyncio.sleep(min(2.0, timeout) * speed)
-        duration = (time.monotonic() - start) * 1000
-        logger.info("linear_insert: complete in %.0fms (mock)", duration)
+        duration = elapsed_ms(start_ns)
+        logger.debug("linear_insert: complete in %.0fms (mock)", duration)
         return PrimitiveResult(
             success=True,
             actual_force=force_limit * 0.6,
@@ -426,58 +453,59 @@ async def linear_insert(
     # Real path — interpolate toward target, monitoring force
     current = obs_to_joints(robot.get_observation())
     target = pad_target(target_pose, current)
-    compliant = compliance_axes or [False] * 7
-    forces: list[list[float]] = []
-
-    while (time.monotonic() - start) < timeout:
-        current = obs_to_joints(robot.get_observation())
-        torques = read_torques_list(robot)
+    compliant = np.asarray(compliance_axes or [False] * 7, dtype=bool)[:JOINT_COUNT]
+    if len(compliant) < JOINT_COUNT:
+        compliant = np.pad(compliant, (0, JOINT_COUNT - len(compliant)))
+    forces = ForceTrace.for_duration(timeout)
+    alpha = min(1.0, CONTROL_DT * 1.0)  # loop-invariant
+    # Fold the compliance mask into the gain: compliant axes get alpha 0 and
+    # simply hold position, so the tick body needs no per-axis select.
+    alpha_vec = np.where(compliant, np.float32(0.0), np.float32(alpha))
+    action: dict[str, float] = {}
+    torques = np.empty(JOINT_COUNT, dtype=np.float32)
+
+    async for _tick in tick_loop(start_ns, timeout_ns):
+        read_state_into(robot, current, torques)
         forces.append(torques)
         peak = peak_abs_torque(torques[:6])
 
         # Force limit — confirms part is seated
         if peak >= force_limit:
-            duration = (time.monotonic() - start) * 1000
-            logger.info("linear_insert: force limit at %.2fNm in %.0fms", peak, duration)
+            duration = elapsed_ms(start_ns)
+            logger.debug("linear_insert: force limit at %.2fNm in %.0fms", peak, duration)
             return PrimitiveResult(
                 success=True,
                 actual_force=peak,
-                actual_position=current,
+                actual_position=current.tolist(),
                 duration_ms=duration,
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
         # Position convergence
         if position_reached(current, target):
-            duration = (time.monotonic() - start) * 1000
-            logger.info("linear_insert: position reached in %.0fms", duration)
+            duration = elapsed_ms(start_ns)
+            logger.debug("linear_insert: position reached in %.0fms", duration)
             return PrimitiveResult(
                 success=True,
                 actual_force=peak,
-                actual_position=current,
+                actual_position=current.tolist(),
                 duration_ms=duration,
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
-        # Interpolate toward target; skip compliant axes (hold position)
-        alpha = min(1.0, CONTROL_DT * 1.0)
-        command = list(current)
-        for i in range(min(len(target), len(current))):
-            if i < len(compliant) and compliant[i]:
-                continue  # compliant — hold position
-            command[i] = current[i] + alpha * (target[i] - current[i])
-        robot.send_action(joints_to_action(command))
-        await asyncio.sleep(CONTROL_DT)
-
-    duration = (time.monotonic() - start) * 1000
+        # Interpolate toward target; hold position on compliant axes
+        command = current + alpha_vec * (target - current)
+        robot.send_action(joints_to_action_into(command, action))
+
+    duration = elapsed_ms(start_ns)
     logger.warning("linear_insert: timed out after %.0fms", duration)
     return PrimitiveResult(
         success=False,
-        actual_position=current,
-        actual_force=peak_abs_torque(forces[-1]) if forces else 0.0,
+        actual_position=current.tolist(),
+        actual_force=peak_abs_torque(forces.last) if len(forces) else 0.0,
         duration_ms=duration,
         error_message=f"linear_insert timed out after {timeout:.1f}s",
-        force_history=forces,
+        force_history=forces.asarray(),
     )
 
 
@@ -510,71 +538,71 @@ async def screw(
         PrimitiveResult with final torque reading.
     """
     speed = kwargs.pop("_speed_factor", 1.0)
-    logger.info("screw: rotations=%.1f torque_limit=%.1fNm", rotations, torque_limit)
-    start = time.monotonic()
+    logger.debug("screw: rotations=%.1f torque_limit=%.1fNm", rotations, torque_limit)
+    start_ns = time.perf_counter_ns()
+    timeout_ns = int(timeout * 1e9)
 
     # Mock path
     if robot is None:
         await asyncio.sleep(min(2.0, timeout) * speed)
-        duration = (time.monotonic() - start) * 1000
-        logger.info("screw: complete in %.0fms (mock)", duration)
+        duration = elapsed_ms(start_ns)
+        logger.debug("screw: complete in %.0fms (mock)", duration)
         return PrimitiveResult(success=True, actual_force=torque_limit * 0.8, duration_ms=duration)
 
     # Real path — rotate wrist incrementally
-    import math
-
     current = obs_to_joints(robot.get_observation())
-    wrist_start = current[5]  # link5 is the wrist
+    wrist_start = float(current[5])  # link5 is the wrist
     total_angle = rotations * 2 * math.pi
     rotation_speed = 0.5  # rad/s
-    forces: list[list[float]] = []
+    wrist_step = rotation_speed * CONTROL_DT  # per-tick increment, loop-invariant
+    forces = ForceTrace.for_duration(timeout)
+    action: dict[str, float] = {}
+    torques = np.empty(JOINT_COUNT, dtype=np.float32)
 
-    while (time.monotonic() - start) < timeout:
-        current = obs_to_joints(robot.get_observation())
-        torques = read_torques_list(robot)
+    async for _tick in tick_loop(start_ns, timeout_ns):
+        read_state_into(robot, current, torques)
         forces.append(torques)
-        wrist_torque = abs(torques[5])  # link5 torque
+        wrist_torque = float(abs(torques[5]))  # link5 torque
 
         # Torque limit reached
         if wrist_torque >= torque_limit:
-            duration = (time.monotonic() - start) * 1000
-            logger.info("screw: torque limit at %.2fNm in %.0fms", wrist_torque, duration)
+            duration = elapsed_ms(start_ns)
+            logger.debug("screw: torque limit at %.2fNm in %.0fms", wrist_torque, duration)
             return PrimitiveResult(
                 success=True,
                 actual_force=wrist_torque,
-                actual_position=current,
+                actual_position=current.tolist(),
                 duration_ms=duration,
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
         # Check if rotations complete
-        wrist_delta = abs(current[5] - wrist_start)
+        wrist_delta = abs(float(current[5]) - wrist_start)
         if wrist_delta >= total_angle:
-            duration = (time.monotonic() - start) * 1000
-            logger.info("screw: %.1f rotations complete in %.0fms", rotations, duration)
+            duration = elapsed_ms(start_ns)
+            logger.debug("screw: %.1f rotations complete in %.0fms", rotations, duration)
             return PrimitiveResult(
                 success=True,
                 actual_force=wrist_torque,
-                actual_position=current,
+                actual_position=current.tolist(),
                 duration_ms=duration,
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
-        # Increment wrist, hold other joints
-        command = list(current)
-        command[5] += rotation_speed * CONTROL_DT
-        robot.send_action(joints_to_action(command))
-        await asyncio.sleep(CONTROL_DT)
+        # Increment wrist, hold other joints. Mutating current is safe:
+        # it is re-read at the top of the next tick.
+        current[5] += wrist_step
+        robot.send_action(joints_to_action_into(current, action))
 
-    duration = (time.monotonic() - start) * 1000
+    duration = elapsed_ms(start_ns)
     logger.warning("screw: timed out after %.0fms", duration)
     return PrimitiveResult(
         success=False,
-        actual_position=current,
-        actual_force=abs(read_torques_list(robot)[5]),
+        actual_position=current.tolist(),
+        actual_force=float(abs(forces.last[5])) if len(forces) else 0.0,
         duration_ms=duration,
         error_message=f"screw timed out after {timeout:.1f}s",
-        force_history=forces,
+        force_history=forces.asarray(),
     )
 
 
@@ -605,74 +633,76 @@ async def press_fit(
     """
     speed = kwargs.pop("_speed_factor", 1.0)
     direction = direction or [0, 0, -1]
-    logger.info(
+    logger.debug(
         "press_fit: dir=%s target=%.1fNm max=%.3fm",
         direction,
         force_target,
         max_distance,
     )
-    start = time.monotonic()
+    start_ns = time.perf_counter_ns()
+    timeout_ns = int(timeout * 1e9)
 
     # Mock path
     if robot is None:
         await asyncio.sleep(min(1.5, timeout) * speed)
-        duration = (time.monotonic() - start) * 1000
-        logger.info("press_fit: complete at %.1fNm in %.0fms (mock)", force_target, duration)
+        duration = elapsed_ms(start_ns)
+        logger.debug("press_fit: complete at %.1fNm in %.0fms (mock)", force_target, duration)
         return PrimitiveResult(success=True, actual_force=force_target, duration_ms=duration)
 
     # Real path — push until force target
     current = obs_to_joints(robot.get_observation())
-    origin = list(current)
-    forces: list[list[float]] = []
-    dir_padded = list(direction) + [0.0] * max(0, 7 - len(direction))
+    origin = current.copy()
+    forces = ForceTrace.for_duration(timeout)
+    dir_padded = np.zeros(JOINT_COUNT, dtype=np.float32)
+    dir_padded[: min(len(direction), JOINT_COUNT)] = direction[:JOINT_COUNT]
     step_size = CONTROL_DT * 0.3  # slower push than guarded_move
+    step_vec = dir_padded * np.float32(step_size)  # per-tick displacement, loop-invariant
+    action: dict[str, float] = {}
+    torques = np.empty(JOINT_COUNT, dtype=np.float32)
 
-    while (time.monotonic() - start) < timeout:
-        current = obs_to_joints(robot.get_observation())
-        torques = read_torques_list(robot)
+    async for _tick in tick_loop(start_ns, timeout_ns):
+        read_state_into(robot, current, torques)
         forces.append(torques)
-        peak = peak_abs_torque(torques[:6])
+        peak, displacement = contact_metrics(torques, current, origin)
 
         # Target force reached
         if peak >= force_target:
-            duration = (time.monotonic() - start) * 1000
-            logger.info("press_fit: target force %.2fNm in %.0fms", peak, duration)
+            duration = elapsed_ms(start_ns)
+            logger.debug("press_fit: target force %.2fNm in %.0fms", peak, duration)
             return PrimitiveResult(
                 success=True,
                 actual_force=peak,
-                actual_position=current,
+                actual_position=current.tolist(),
                 duration_ms=duration,
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
         # Max distance exceeded
-        displacement = sum((c - o) ** 2 for c, o in zip(current, origin, strict=False)) ** 0.5
         if displacement >= max_distance:
-            duration = (time.monotonic() - start) * 1000
+            duration = elapsed_ms(start_ns)
             logger.warning("press_fit: max distance without target force")
             return PrimitiveResult(
                 success=False,
                 actual_force=peak,
-                actual_position=current,
+                actual_position=current.tolist(),
                 duration_ms=duration,
                 error_message=(
                     f"Max distance {max_distance:.3f} reached "
                     f"(force {peak:.2f}Nm < target {force_target:.2f}Nm)"
                 ),
-                force_history=forces,
+                force_history=forces.asarray(),
             )
 
-        command = [c + d * step_size for c, d in zip(current, dir_padded, strict=False)]
-        robot.send_action(joints_to_action(command))
-        await asyncio.sleep(CONTROL_DT)
+        command = current + step_vec
+        robot.send_action(joints_to_action_into(command, action))
 
-    duration = (time.monotonic() - start) * 1000
+    duration = elapsed_ms(start_ns)
     logger.warning("press_fit: timed out after %.0fms", duration)
     return PrimitiveResult(
         success=False,
-        actual_position=current,
-        actual_force=peak_abs_torque(forces[-1]) if forces else 0.0,
+        actual_position=current.tolist(),
+        actual_force=peak_abs_torque(forces.last) if len(forces) else 0.0,
         duration_ms=duration,
         error_message=f"press_fit timed out after {timeout:.1f}s",
-        force_history=forces,
+        force_history=forces.asarray(),
     )
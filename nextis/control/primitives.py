@@ -13,6 +13,7 @@ This module re-exports them and provides :class:`PrimitiveResult` (via
 
 from __future__ import annotations
 
+import functools
 import logging
 from collections.abc import Awaitable, Callable
 from typing import Any
@@ -48,6 +49,7 @@ class PrimitiveLibrary:
 
     def __init__(self, speed_factor: float = 1.0) -> None:
         self._primitives: dict[str, PrimitiveFn] = {}
+        self._bound: dict[str, PrimitiveFn] = {}
         self._speed = speed_factor
         self._register_defaults()
 
@@ -69,6 +71,9 @@ class PrimitiveLibrary:
             fn: Async callable implementing the primitive.
         """
         self._primitives[name] = fn
+        # Bind the speed factor once at registration so dispatch is a dict
+        # lookup + call, and run() no longer injects it into caller params.
+        self._bound[name] = functools.partial(fn, _speed_factor=self._speed)
         logger.debug("Registered primitive: %s", name)
 
     async def run(
@@ -90,13 +95,12 @@ class PrimitiveLibrary:
         Raises:
             AssemblyError: If the primitive name is not registered.
         """
-        fn = self._primitives.get(name)
-        if fn is None:
-            raise AssemblyError(f"Unknown primitive: {name}")
-        params = params or {}
-        params["_speed_factor"] = self._speed
+        try:
+            fn = self._bound[name]
+        except KeyError:
+            raise AssemblyError(f"Unknown primitive: {name}") from None
         logger.info("Dispatching primitive '%s' with params: %s", name, params)
-        return await fn(robot=robot, **params)
+        return await fn(robot=robot, **(params or {}))
 
     @property
     def available(self) -> list[str]:
@@ -13,6 +13,8 @@ import logging
 import time
 from typing import Any
 
+import numpy as np
+
 from nextis.assembly.models import AssemblyStep
 from nextis.control.primitives import PrimitiveLibrary
 from nextis.execution.types import StepResult
@@ -103,7 +105,9 @@ class PolicyRouter:
                 mock_data = mock.generate_execution_data(step, force_success=step_result.success)
                 step_result.actual_force = mock_data.peak_force
                 step_result.actual_position = mock_data.final_position
-                step_result.force_history = [[f] for f in mock_data.force_history]
+                step_result.force_history = np.asarray(
+                    mock_data.force_history, dtype=np.float32
+                ).reshape(-1, 1)
 
             return step_result
         except Exception as e:
@@ -171,7 +175,9 @@ class PolicyRouter:
                     handler_used="policy",
                     actual_force=mock_data.peak_force,
                     actual_position=mock_data.final_position,
-                    force_history=[[f] for f in mock_data.force_history],
+                    force_history=np.asarray(mock_data.force_history, dtype=np.float32).reshape(
+                        -1, 1
+                    ),
                 )
 
             return StepResult(
@@ -207,8 +213,6 @@ class PolicyRouter:
             return await self._run_policy(step, start_ms)
 
         try:
-            import numpy as np
-
             from nextis.control.motion_helpers import joints_to_action, obs_to_joints
             from nextis.learning.sac import SACAgent
 
@@ -242,7 +246,9 @@ class PolicyRouter:
                     handler_used="rl_finetune",
                     actual_force=mock_data.peak_force,
                     actual_position=mock_data.final_position,
-                    force_history=[[f] for f in mock_data.force_history],
+                    force_history=np.asarray(mock_data.force_history, dtype=np.float32).reshape(
+                        -1, 1
+                    ),
                 )
 
             return StepResult(
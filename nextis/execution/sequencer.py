@@ -17,6 +17,8 @@ import time
 from collections.abc import Callable
 from enum import Enum  # noqa: UP042
 
+import numpy as np
+
 from nextis.analytics.store import AnalyticsStore
 from nextis.api.schemas import ExecutionState, StepRuntimeState
 from nextis.assembly.models import AssemblyGraph, AssemblyStep
@@ -299,15 +301,16 @@ class Sequencer:
                     # Verify step outcome if dispatch reported success
                     if result.success and self._verifier:
                         # Convert per-joint torque history to magnitude series
-                        magnitudes = [
-                            max(abs(t) for t in tick) if tick else 0.0
-                            for tick in result.force_history
-                        ]
+                        fh = np.asarray(result.force_history, dtype=np.float64)
+                        if fh.size:
+                            magnitudes = np.abs(fh).max(axis=1).astype(np.float32)
+                        else:
+                            magnitudes = np.empty(0, dtype=np.float32)
                         exec_data = ExecutionData(
                             final_position=result.actual_position,
                             force_history=magnitudes,
                             peak_force=result.actual_force,
-                            final_force=magnitudes[-1] if magnitudes else 0.0,
+                            final_force=float(magnitudes[-1]) if magnitudes.size else 0.0,
                             duration_ms=result.duration_ms,
                         )
                         vr = await self._verifier.verify(step, exec_data)
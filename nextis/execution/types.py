@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+import numpy as np
+
 
 @dataclass
 class StepResult:
@@ -20,7 +22,9 @@ class StepResult:
         error_message: Description of failure, if any.
         actual_force: Peak force/torque measured during step (Nm).
         actual_position: Joint positions at step completion.
-        force_history: Per-tick joint torques captured during step execution.
+        force_history: Per-tick joint torques captured during step execution
+            as a ``(ticks, joints)`` float32 array. Nested lists passed by
+            legacy callers are cast on construction.
     """
 
     success: bool
@@ -29,4 +33,8 @@ class StepResult:
     error_message: str | None = None
     actual_force: float = 0.0
     actual_position: list[float] = field(default_factory=list)
-    force_history: list[list[float]] = field(default_factory=list)
+    force_history: np.ndarray = field(default_factory=lambda: np.empty((0, 7), dtype=np.float32))
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.force_history, np.ndarray):
+            self.force_history = np.asarray(self.force_history, dtype=np.float32)
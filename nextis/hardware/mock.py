@@ -9,14 +9,16 @@ from __future__ import annotations
 
 import logging
 import math
-import random
+import sys
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 import numpy as np
 
-from nextis.assembly.models import AssemblyStep
+from nextis.assembly.models import AssemblyStep, SuccessCriteria
 from nextis.perception.types import ExecutionData
 
 logger = logging.getLogger(__name__)
@@ -31,8 +33,31 @@ MOCK_JOINT_NAMES: list[str] = [
     "gripper",
 ]
 
-
-@dataclass
+# Constant across all mock robots; a read-only view avoids rebuilding the
+# dict on every SafetyLayer poll.
+_TORQUE_LIMITS: Mapping[str, float] = MappingProxyType({n: 10.0 for n in MOCK_JOINT_NAMES})
+
+# Shared interned key tuples: every mock builds its dicts from the same
+# string objects, so downstream lookups are pointer comparisons and no hot
+# path ever formats or str.replace()s a key.
+_POS_KEYS: tuple[str, ...] = tuple(sys.intern(f"{n}.pos") for n in MOCK_JOINT_NAMES)
+_BARE_KEYS: tuple[str, ...] = tuple(sys.intern(n) for n in MOCK_JOINT_NAMES)
+_BARE_FROM_SUFFIXED: dict[str, str] = dict(zip(_POS_KEYS, _BARE_KEYS, strict=False))
+
+# Deterministic force-signature templates, computed once at import as float32
+# arrays (the ExecutionData dtype, so the checkers take them without a cast).
+# The generators return fresh copies built from these, never the templates
+# themselves, so callers may mutate their histories freely.
+_SNAP_HEAD: np.ndarray = np.concatenate([np.linspace(0.5, 5.0, 16), [2.0, 1.5, 1.2, 1.1]]).astype(
+    np.float32
+)
+_MESHING_SUCCESS: np.ndarray = (
+    1.5 + 1.2 * np.sin(np.arange(40, dtype=np.float64) * (math.pi / 4))
+).astype(np.float32)
+_MESHING_FAIL: np.ndarray = np.linspace(0.1, 2.0, 30, dtype=np.float32)
+
+
+@dataclass(slots=True)
 class MockCalibration:
     """Minimal calibration entry matching the TeleopLoop interface."""
 
@@ -40,7 +65,7 @@ class MockCalibration:
     range_max: float = 4096.0
 
 
-@dataclass
+@dataclass(slots=True)
 class _MockMotor:
     """Motor stub with an ID."""
 
@@ -52,16 +77,35 @@ class _MockMotor:
 
 
 class MockBus:
-    """Minimal bus stub satisfying robot.bus and leader.bus interfaces."""
+    """Minimal bus stub satisfying robot.bus and leader.bus interfaces.
+
+    Joint positions are stored as one contiguous float64 array indexed by
+    :data:`MOCK_JOINT_NAMES` order; ``_last_positions`` is a dict view kept
+    for legacy consumers (e.g. the TeleopLoop startup-blend fallback).
+    """
+
+    __slots__ = (
+        "_positions",
+        "_name_to_idx",
+        "_can_bus_dead",
+        "_software_homing_offsets",
+        "motors",
+    )
 
     def __init__(self) -> None:
-        self._last_positions: dict[str, float] = {n: 0.0 for n in MOCK_JOINT_NAMES}
+        self._positions = np.zeros(len(MOCK_JOINT_NAMES), dtype=np.float64)
+        self._name_to_idx: dict[str, int] = {n: i for i, n in enumerate(MOCK_JOINT_NAMES)}
         self._can_bus_dead: bool = False
         self._software_homing_offsets: dict[int, int] = {}
         self.motors: dict[str, _MockMotor] = {
             name: _MockMotor(motor_id=i) for i, name in enumerate(MOCK_JOINT_NAMES)
         }
 
+    @property
+    def _last_positions(self) -> dict[str, float]:
+        """Dict snapshot of joint positions, keyed by bare motor name."""
+        return dict(zip(_BARE_KEYS, self._positions.tolist(), strict=False))
+
     def write(self, register: str, motor_name: str, value: Any, **kwargs: Any) -> None:
         """No-op register write."""
 
@@ -86,39 +130,90 @@ class MockRobot:
         self.is_connected: bool = True
         self._start_time = time.monotonic()
         self._commanded: dict[str, float] | None = None
+        # Read-only snapshots rebuilt on send_action so observation reads in
+        # the teleop fast path return frozen views instead of fresh copies.
+        self._commanded_view: Mapping[str, float] | None = None
+        self._bare_view: Mapping[str, float] | None = None
+        # Hoisted out of get_observation: the per-joint phase offsets are
+        # constant, so each call is one vectorized np.sin instead of 7 math.sin.
+        self._obs_phase = np.arange(len(MOCK_JOINT_NAMES), dtype=np.float64) * 0.5
+        self._obs_buf = np.empty(len(MOCK_JOINT_NAMES), dtype=np.float64)
+        # Single per-robot Generator for all randomness: batched draws beat
+        # scalar random.* calls, there is no global-lock contention, and
+        # seeding it makes mock telemetry reproducible in tests.
+        self._rng = np.random.default_rng()
+        # Rolling pool of unit-uniform samples for pure-noise telemetry:
+        # slices are scaled per request, so the RNG runs once per ~8k
+        # samples instead of once per generate_execution_data call.
+        self._noise_pool = self._rng.random(8192)
+        self._noise_cursor = 0
+
+    def reset(self) -> None:
+        """Forget commanded state so observations revert to the sine path.
+
+        Lets tests share one robot instance across runs instead of paying
+        construction (noise pool, calibration dicts) per test.
+        """
+        self._commanded = None
+        self._commanded_view = None
+        self._bare_view = None
+        self.bus._positions[:] = 0.0
+        self._start_time = time.monotonic()
 
-    def get_observation(self) -> dict[str, float]:
+    def get_observation(self) -> Mapping[str, float]:
         """Return joint positions.
 
-        If :meth:`send_action` has been called, returns the last commanded
-        positions (the robot "obeys"). Otherwise returns sine-wave positions
-        for passive observation scenarios (e.g. TeleopLoop).
+        If :meth:`send_action` has been called, returns a read-only view of
+        the last commanded positions (the robot "obeys"). Otherwise returns
+        sine-wave positions for passive observation scenarios (e.g.
+        TeleopLoop). Callers that need a mutable copy must ``dict()`` it.
         """
-        if self._commanded is not None:
-            return dict(self._commanded)
+        if self._commanded_view is not None:
+            return self._commanded_view
         t = time.monotonic() - self._start_time
-        return {
-            f"{n}.pos": math.sin(t * 0.5 + i * 0.5) * 0.3 for i, n in enumerate(MOCK_JOINT_NAMES)
-        }
+        buf = self._obs_buf
+        np.add(self._obs_phase, t * 0.5, out=buf)
+        np.sin(buf, out=buf)
+        buf *= 0.3
+        return dict(zip(_POS_KEYS, buf.tolist(), strict=False))
 
     def send_action(self, action: dict[str, float]) -> None:
         """Accept action, update bus positions and commanded state."""
         self._commanded = dict(action)
-        for key, val in action.items():
-            self.bus._last_positions[key.replace(".pos", "")] = val
+        self._commanded_view = MappingProxyType(self._commanded)
+        bare = {
+            _BARE_FROM_SUFFIXED.get(key, key.removesuffix(".pos")): val
+            for key, val in action.items()
+        }
+        positions = self.bus._positions
+        name_to_idx = self.bus._name_to_idx
+        for name, val in bare.items():
+            idx = name_to_idx.get(name)
+            if idx is not None:
+                positions[idx] = val
+        self._bare_view = MappingProxyType(bare)
 
     def get_torques(self) -> dict[str, float]:
         """Return small random torques."""
-        return {n: random.uniform(-0.1, 0.1) for n in MOCK_JOINT_NAMES}
-
-    def get_torque_limits(self) -> dict[str, float]:
-        """Return generous mock limits."""
-        return {n: 10.0 for n in MOCK_JOINT_NAMES}
-
-    def get_cached_positions(self) -> dict[str, float]:
-        """Return current observation keyed by bare motor name."""
+        vals = self._rng.uniform(-0.1, 0.1, len(_BARE_KEYS))
+        return dict(zip(_BARE_KEYS, vals.tolist(), strict=False))
+
+    def get_state(self) -> tuple[dict[str, float], dict[str, float]]:
+        """Return (observation, torques) as one call, mimicking a bulk read."""
+        return self.get_observation(), self.get_torques()
+
+    def get_torque_limits(self) -> Mapping[str, float]:
+        """Return generous mock limits (shared read-only mapping)."""
+        return _TORQUE_LIMITS
+
+    def get_cached_positions(self) -> Mapping[str, float]:
+        """Return current observation keyed by bare motor name (read-only)."""
+        if self._bare_view is not None:
+            return self._bare_view
+        # Sine-path observations are keyed by _POS_KEYS in order, so re-keying
+        # is a presized dict(zip(...)) rather than a comprehension.
         obs = self.get_observation()
-        return {k.replace(".pos", ""): v for k, v in obs.items()}
+        return dict(zip(_BARE_KEYS, obs.values(), strict=False))
 
     def generate_execution_data(
         self,
@@ -137,125 +232,131 @@ class MockRobot:
                 ``False``, always failing.  If ``None`` (default), 80 %
                 chance of success.
         """
-        succeed = force_success if force_success is not None else (random.random() < 0.8)
+        succeed = force_success if force_success is not None else (self._rng.random() < 0.8)
         criteria = step.success_criteria
         params = step.primitive_params or {}
         target_pose = params.get("target_pose", [0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
-        duration_ms = random.uniform(500, 3000)
-
-        if criteria.type == "force_threshold":
-            return self._gen_force_threshold(criteria.threshold, target_pose, succeed, duration_ms)
-        if criteria.type == "position":
-            return self._gen_position(target_pose, succeed, duration_ms)
-        if criteria.type == "force_signature":
-            return self._gen_force_signature(
-                criteria.pattern, criteria.threshold, target_pose, succeed, duration_ms
-            )
-        # classifier or unknown — return minimal data
-        return ExecutionData(duration_ms=duration_ms)
+        duration_ms = float(self._rng.uniform(500, 3000))
+
+        handler = self._GENERATORS.get(criteria.type)
+        if handler is None:
+            # classifier or unknown — return minimal data
+            return ExecutionData(duration_ms=duration_ms)
+        return handler(self, criteria, target_pose, succeed, duration_ms)
+
+    def _noise(self, n: int, scale: float) -> np.ndarray:
+        """Return ``n`` uniform [0, scale) float32 samples from the rolling noise pool."""
+        start = self._noise_cursor
+        if start + n > len(self._noise_pool):
+            start = 0
+        self._noise_cursor = start + n
+        return (self._noise_pool[start : start + n] * scale).astype(np.float32)
 
     # -- private generators ---------------------------------------------------
 
     def _gen_force_threshold(
         self,
-        threshold: float | None,
+        criteria: SuccessCriteria,
         target_pose: list[float],
         succeed: bool,
         duration_ms: float,
     ) -> ExecutionData:
         """Force-threshold criteria: ramp to peak above or below threshold."""
-        thr = threshold or 1.0
+        thr = criteria.threshold or 1.0
         if succeed:
-            peak = thr * 1.2
-            force_history = list(np.linspace(thr * 0.1, peak, 30))
+            buf = np.linspace(thr * 0.1, thr * 1.2, 30)
         else:
-            peak = thr * 0.6
-            force_history = list(np.random.uniform(thr * 0.1, peak, 30))
+            buf = self._rng.uniform(thr * 0.1, thr * 0.6, 30)
         return ExecutionData(
             final_position=list(target_pose[:3]),
-            force_history=force_history,
-            peak_force=float(max(force_history)),
-            final_force=float(force_history[-1]),
+            force_history=buf.astype(np.float32),
+            peak_force=float(buf.max()),
+            final_force=float(buf[-1]),
             duration_ms=duration_ms,
         )
 
     def _gen_position(
         self,
+        criteria: SuccessCriteria,
         target_pose: list[float],
         succeed: bool,
         duration_ms: float,
     ) -> ExecutionData:
-        """Position criteria: final position near or far from target."""
+        """Position criteria: final position near or far from target (criteria unused)."""
         target = np.array(target_pose[:3], dtype=np.float64)
         if succeed:
-            offset = np.random.uniform(-0.3, 0.3, 3)
+            offset = self._rng.uniform(-0.3, 0.3, 3)
         else:
             offset = np.zeros(3)
-            offset[random.randint(0, 2)] = 5.0
+            offset[int(self._rng.integers(0, 3))] = 5.0
         final = target + offset
-        noise = list(np.random.uniform(0.0, 0.5, 20))
+        noise = self._noise(20, 0.5)
         return ExecutionData(
             final_position=final.tolist(),
             force_history=noise,
-            peak_force=float(max(noise)),
+            peak_force=float(noise.max()),
             final_force=float(noise[-1]),
             duration_ms=duration_ms,
         )
 
     def _gen_force_signature(
         self,
-        pattern: str | None,
-        threshold: float | None,
+        criteria: SuccessCriteria,
         target_pose: list[float],
         succeed: bool,
         duration_ms: float,
     ) -> ExecutionData:
         """Force-signature criteria: snap_fit / meshing / press_fit patterns."""
+        pattern = criteria.pattern
         if pattern == "snap_fit":
             fh = self._gen_snap_fit(succeed)
         elif pattern == "meshing":
             fh = self._gen_meshing(succeed)
         elif pattern == "press_fit":
-            fh = self._gen_press_fit(threshold, succeed)
+            fh = self._gen_press_fit(criteria.threshold, succeed)
         else:
-            fh = list(np.random.uniform(0.0, 0.3, 20))
+            fh = self._noise(20, 0.3)
         return ExecutionData(
             final_position=list(target_pose[:3]),
             force_history=fh,
-            peak_force=float(max(fh)) if fh else 0.0,
-            final_force=float(fh[-1]) if fh else 0.0,
+            peak_force=float(fh.max()) if fh.size else 0.0,
+            final_force=float(fh[-1]) if fh.size else 0.0,
             duration_ms=duration_ms,
         )
 
-    @staticmethod
-    def _gen_snap_fit(succeed: bool) -> list[float]:
+    def _gen_snap_fit(self, succeed: bool) -> np.ndarray:
         """Snap-fit: peak then sharp drop, or flat noise."""
         if succeed:
-            ramp = np.linspace(0.5, 5.0, 16).tolist()
-            drop = [2.0, 1.5, 1.2, 1.1]
-            hold = [1.0 + random.uniform(-0.1, 0.1) for _ in range(10)]
-            return ramp + drop + hold
-        return [random.uniform(0.0, 0.05) for _ in range(30)]
+            hold = 1.0 + self._rng.uniform(-0.1, 0.1, 10)
+            return np.concatenate([_SNAP_HEAD, hold]).astype(np.float32)
+        return self._rng.uniform(0.0, 0.05, 30).astype(np.float32)
 
     @staticmethod
-    def _gen_meshing(succeed: bool) -> list[float]:
+    def _gen_meshing(succeed: bool) -> np.ndarray:
         """Meshing: oscillating peaks, or monotonic rise."""
         if succeed:
-            return [1.5 + 1.2 * math.sin(i * math.pi / 4) for i in range(40)]
-        return list(np.linspace(0.1, 2.0, 30))
+            return _MESHING_SUCCESS.copy()
+        return _MESHING_FAIL.copy()
 
-    @staticmethod
-    def _gen_press_fit(threshold: float | None, succeed: bool) -> list[float]:
+    def _gen_press_fit(self, threshold: float | None, succeed: bool) -> np.ndarray:
         """Press-fit: monotonic rise to target, or plateau below."""
         thr = threshold or 5.0
         if succeed:
-            base = np.linspace(0.2, thr * 1.1, 30)
-            jitter = np.random.uniform(-0.05, 0.05, 30)
-            return (base + jitter).tolist()
+            buf = np.linspace(0.2, thr * 1.1, 30)
+            buf += self._rng.uniform(-0.05, 0.05, 30)
+            return buf.astype(np.float32)
         # Ramp to 40% then plateau
-        ramp = np.linspace(0.2, thr * 0.4, 10).tolist()
-        plateau = [thr * 0.4 + random.uniform(-0.3, 0.3) for _ in range(10)]
-        return ramp + plateau
+        ramp = np.linspace(0.2, thr * 0.4, 10)
+        plateau = thr * 0.4 + self._rng.uniform(-0.3, 0.3, 10)
+        return np.concatenate([ramp, plateau]).astype(np.float32)
+
+    # O(1) dispatch for generate_execution_data; criteria types without an
+    # entry (e.g. "classifier") fall back to minimal data.
+    _GENERATORS = {
+        "force_threshold": _gen_force_threshold,
+        "position": _gen_position,
+        "force_signature": _gen_force_signature,
+    }
 
     def disconnect(self) -> None:
         """Mark as disconnected."""
@@ -272,11 +373,14 @@ class MockLeader:
     def __init__(self) -> None:
         self.bus = MockBus()
         self._start_time = time.monotonic()
+        self._act_phase = np.arange(len(MOCK_JOINT_NAMES), dtype=np.float64) * 0.7 + 1.0
+        self._act_buf = np.empty(len(MOCK_JOINT_NAMES), dtype=np.float64)
 
     def get_action(self) -> dict[str, float]:
         """Return sine-wave positions mimicking human motion."""
         t = time.monotonic() - self._start_time
-        return {
-            f"{n}.pos": math.sin(t * 0.3 + i * 0.7 + 1.0) * 0.2
-            for i, n in enumerate(MOCK_JOINT_NAMES)
-        }
+        buf = self._act_buf
+        np.add(self._act_phase, t * 0.3, out=buf)
+        np.sin(buf, out=buf)
+        buf *= 0.2
+        return dict(zip(_POS_KEYS, buf.tolist(), strict=False))
@@ -50,7 +50,7 @@ class StepRewardComputer:
         self,
         obs: np.ndarray,
         action: np.ndarray,
-        torques: list[float],
+        torques: np.ndarray | list[float],
         force_history: list[float],
     ) -> float:
         """Compute dense shaping reward for a single timestep.
@@ -76,8 +76,8 @@ class StepRewardComputer:
             reward += -0.1 * distance
 
         # Force shaping: reward proportional to peak_force / threshold
-        if self._force_threshold is not None and torques:
-            peak = max(abs(t) for t in torques)
+        if self._force_threshold is not None and len(torques):
+            peak = float(np.max(np.abs(torques)))
             ratio = min(peak / self._force_threshold, 1.0)
             reward += 0.1 * ratio
 
@@ -316,7 +316,7 @@ class StepRLTrainer:
 
             # Read telemetry
             torques = read_torques_list(self._robot)
-            peak_torque = max(abs(t) for t in torques) if torques else 0.0
+            peak_torque = float(np.abs(torques).max()) if torques.size else 0.0
             force_history.append(peak_torque)
 
             # Compute dense reward
@@ -6,18 +6,34 @@ tracking, cancellation, and JSON persistence to survive page refreshes.
 
 from __future__ import annotations
 
-import json
+import itertools
 import logging
+import os
 import time
-import uuid
 from pathlib import Path
 
+import orjson
+
 from nextis.errors import TrainingError
 from nextis.learning.dataset import StepDataset
 from nextis.learning.trainer import PolicyTrainer, TrainingConfig, TrainingProgress
 
 logger = logging.getLogger(__name__)
 
+# Job IDs are UI labels persisted to disk; a timestamp + pid qualified
+# counter keeps them unique across restarts without uuid4's getrandom
+# syscall — the counter alone resets with the process.
+_job_counter = itertools.count(1)
+
+
+def _next_job_id() -> str:
+    return (
+        f"{int(time.time()) & 0xFFFFFF:06x}"
+        f"{os.getpid() & 0xFFFF:04x}"
+        f"{next(_job_counter) & 0xFF:02x}"
+    )
+
+
 # ------------------------------------------------------------------
 # Training presets
 # ------------------------------------------------------------------
@@ -113,8 +129,8 @@ class TrainingJob:
         """Persist job state to ``{jobs_dir}/{job_id}.json``."""
         jobs_dir.mkdir(parents=True, exist_ok=True)
         path = jobs_dir / f"{self.job_id}.json"
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        # Machine-read state, not human-canonical config — write packed bytes.
+        path.write_bytes(orjson.dumps(self.to_dict()))
 
     @classmethod
     def from_dict(cls, data: dict) -> TrainingJob:
@@ -187,7 +203,7 @@ class TrainingService:
                 "Record at least one demonstration first."
             )
 
-        job_id = str(uuid.uuid4())[:8]
+        job_id = _next_job_id()
         job = TrainingJob(job_id, step_id, assembly_id, architecture)
         self._jobs[job_id] = job
         job.save(self._jobs_dir)
@@ -307,9 +323,7 @@ class TrainingService:
         count = 0
         for fpath in self._jobs_dir.glob("*.json"):
             try:
-                with open(fpath) as f:
-                    data = json.load(f)
-                job = TrainingJob.from_dict(data)
+                job = TrainingJob.from_dict(orjson.loads(fpath.read_bytes()))
 
                 # Stale running jobs become failed
                 if job.status == "running":
@@ -13,6 +13,7 @@ Checkers:
 from __future__ import annotations
 
 import logging
+import math
 from pathlib import Path
 
 import numpy as np
@@ -61,9 +62,14 @@ def check_position(step: AssemblyStep, data: ExecutionData) -> VerificationResul
             detail="No final position data available for verification",
         )
 
-    target_xyz = np.array(target_pose[:3], dtype=np.float64)
-    actual_xyz = np.array(data.final_position[:3], dtype=np.float64)
-    distance = float(np.linalg.norm(target_xyz - actual_xyz))
+    # Only xyz is compared, so a single C hypot call beats building two
+    # numpy arrays for a 3-vector.
+    actual = data.final_position
+    distance = math.hypot(
+        target_pose[0] - actual[0],
+        target_pose[1] - actual[1],
+        target_pose[2] - actual[2],
+    )
 
     tolerance = step.success_criteria.threshold or _DEFAULT_POSITION_TOLERANCE_MM
 
@@ -158,23 +164,19 @@ def _detect_meshing(force: np.ndarray, threshold: float | None) -> VerificationR
             passed=False, confidence=0.4, detail="Force history too short for meshing detection"
         )
 
-    # Simple peak detection: a point higher than both neighbors
-    peaks = []
-    for i in range(1, len(force) - 1):
-        if force[i] > force[i - 1] and force[i] > force[i + 1]:
-            peaks.append(i)
-
-    # Filter out noise — peaks must be above 10% of max
-    max_force = float(np.max(force))
-    noise_floor = max_force * 0.1
-    significant_peaks = [p for p in peaks if force[p] > noise_floor]
+    # Peak detection in one vectorized pass: interior points strictly higher
+    # than both neighbors, filtered against a 10%-of-max noise floor.
+    interior = force[1:-1]
+    peak_mask = (interior > force[:-2]) & (interior > force[2:])
+    noise_floor = float(np.max(force)) * 0.1
+    significant_peaks = int(np.count_nonzero(peak_mask & (interior > noise_floor)))
 
-    passed = len(significant_peaks) >= 3
+    passed = significant_peaks >= 3
     return VerificationResult(
         passed=passed,
         confidence=0.8 if passed else 0.6,
-        detail=f"Meshing: {len(significant_peaks)} oscillation peaks detected (need >=3)",
-        measured_value=float(len(significant_peaks)),
+        detail=f"Meshing: {significant_peaks} oscillation peaks detected (need >=3)",
+        measured_value=float(significant_peaks),
         threshold=3.0,
     )
 
@@ -229,7 +231,7 @@ def check_force_signature(step: AssemblyStep, data: ExecutionData) -> Verificati
             detail="No force signature pattern defined — skipping",
         )
 
-    if not data.force_history:
+    if len(data.force_history) == 0:
         return VerificationResult(
             passed=False, confidence=0.6, detail="No force history data for signature analysis"
         )
@@ -10,13 +10,15 @@ from dataclasses import dataclass, field
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionData:
     """Telemetry snapshot captured after step dispatch.
 
     Attributes:
         final_position: End-effector position at step completion (xyz + optional orientation).
-        force_history: Time-series of force magnitudes during execution (N).
+        force_history: Time-series of force magnitudes during execution (N)
+            as a 1-D float32 array. Lists passed by callers are cast on
+            construction; JSON boundaries must ``list()`` it once.
         peak_force: Maximum force observed during execution (N).
         final_force: Force at step completion (N).
         camera_frame: RGB image from workspace camera (H, W, 3) uint8, or None.
@@ -24,12 +26,16 @@ class ExecutionData:
     """
 
     final_position: list[float] = field(default_factory=list)
-    force_history: list[float] = field(default_factory=list)
+    force_history: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
     peak_force: float = 0.0
     final_force: float = 0.0
     camera_frame: np.ndarray | None = None
     duration_ms: float = 0.0
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.force_history, np.ndarray):
+            self.force_history = np.asarray(self.force_history, dtype=np.float32)
+
 
 @dataclass
 class VerificationResult:
@@ -6,6 +6,7 @@ Other modules import ``get_state()`` instead of managing their own singletons.
 
 from __future__ import annotations
 
+import dataclasses
 import enum
 import logging
 import threading
@@ -24,6 +25,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class TeleopSession:
+    """Immutable snapshot of an active teleop session.
+
+    Published as a single reference so readers never observe torn state
+    across the loop / id / arms / mock fields.
+    """
+
+    loop: TeleopLoop
+    id: str
+    arms: tuple[str, ...]
+    mock: bool
+
+
 class SystemPhase(enum.StrEnum):
     """Lifecycle phase of the system."""
 
@@ -53,12 +68,11 @@ class SystemState:
         self._tool_registry: ToolRegistryService | None = None
         self._config_data: dict = {}
 
-        # Mutable — set by route handlers
-        self._teleop_loop: TeleopLoop | None = None
+        # Mutable — set by route handlers. The session is replaced atomically
+        # as one reference; the lock only serializes start/stop mutations.
+        self._teleop_session: TeleopSession | None = None
+        self._teleop_mutate_lock = threading.Lock()
         self._recorder: DemoRecorder | None = None
-        self._teleop_session_id: str | None = None
-        self._teleop_session_arms: list[str] = []
-        self._teleop_session_mock: bool = False
 
     # --- Read-only properties ---
 
@@ -104,13 +118,24 @@ class SystemState:
     # --- Mutable properties (set by route handlers) ---
 
     @property
-    def teleop_loop(self) -> TeleopLoop | None:
-        """Active teleop loop, or None."""
-        return self._teleop_loop
+    def teleop_session(self) -> TeleopSession | None:
+        """Current teleop session snapshot, or None. Lock-free read."""
+        return self._teleop_session
+
+    @teleop_session.setter
+    def teleop_session(self, value: TeleopSession | None) -> None:
+        self._teleop_session = value
 
-    @teleop_loop.setter
-    def teleop_loop(self, value: TeleopLoop | None) -> None:
-        self._teleop_loop = value
+    @property
+    def teleop_mutate_lock(self) -> threading.Lock:
+        """Lock serializing teleop session start/stop transitions."""
+        return self._teleop_mutate_lock
+
+    @property
+    def teleop_loop(self) -> TeleopLoop | None:
+        """Active teleop loop, or None. Derived from the session snapshot."""
+        session = self._teleop_session
+        return session.loop if session is not None else None
 
     @property
     def recorder(self) -> DemoRecorder | None:
@@ -121,33 +146,6 @@ class SystemState:
     def recorder(self, value: DemoRecorder | None) -> None:
         self._recorder = value
 
-    @property
-    def teleop_session_id(self) -> str | None:
-        """Current teleop session ID."""
-        return self._teleop_session_id
-
-    @teleop_session_id.setter
-    def teleop_session_id(self, value: str | None) -> None:
-        self._teleop_session_id = value
-
-    @property
-    def teleop_session_arms(self) -> list[str]:
-        """Arm IDs in the current teleop session."""
-        return self._teleop_session_arms
-
-    @teleop_session_arms.setter
-    def teleop_session_arms(self, value: list[str]) -> None:
-        self._teleop_session_arms = value
-
-    @property
-    def teleop_session_mock(self) -> bool:
-        """Whether the current teleop session is in mock mode."""
-        return self._teleop_session_mock
-
-    @teleop_session_mock.setter
-    def teleop_session_mock(self, value: bool) -> None:
-        self._teleop_session_mock = value
-
     # --- Lifecycle ---
 
     def initialize(self) -> None:
@@ -253,13 +251,14 @@ class SystemState:
                 return
             self._phase = SystemPhase.SHUTTING_DOWN
 
-        if self._teleop_loop is not None:
+        session = self._teleop_session
+        if session is not None:
             try:
-                if self._teleop_loop.is_running:
-                    self._teleop_loop.stop()
+                if session.loop.is_running:
+                    session.loop.stop()
             except Exception as exc:
                 logger.error("Error stopping teleop: %s", exc)
-            self._teleop_loop = None
+            self._teleop_session = None
 
         if self._recorder is not None:
             try:
@@ -317,7 +316,8 @@ class SystemState:
         }
         if self._arm_registry is not None:
             status.update(self._arm_registry.get_status_summary())
-        status["teleopActive"] = self._teleop_loop is not None and self._teleop_loop.is_running
+        session = self._teleop_session
+        status["teleopActive"] = session is not None and session.loop.is_running
         status["recording"] = self._recorder is not None and self._recorder.is_recording
         status["camerasConnected"] = (
             len(self._camera_service.connected_keys) if self._camera_service else 0
@@ -333,11 +333,8 @@ class SystemState:
         self._camera_service = None
         self._tool_registry = None
         self._config_data = {}
-        self._teleop_loop = None
+        self._teleop_session = None
         self._recorder = None
-        self._teleop_session_id = None
-        self._teleop_session_arms = []
-        self._teleop_session_mock = False
 
 
 # --- Module-level singleton ---
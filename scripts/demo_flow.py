@@ -10,14 +10,13 @@ Then open http://localhost:3000, press Space to start execution.
 """
 
 import argparse
+import http.client
 import signal
 import subprocess
 import sys
 import time
 import webbrowser
 from pathlib import Path
-from urllib.error import URLError
-from urllib.request import urlopen
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
@@ -38,18 +37,32 @@ BANNER = """
 """
 
 
-def wait_for_health(url: str, timeout: float = 15.0) -> bool:
-    """Poll the health endpoint until it responds or timeout."""
+def wait_for_health(host: str, port: int, timeout: float = 15.0) -> bool:
+    """Poll the health endpoint until it responds or timeout.
+
+    Keeps one HTTP connection open across probes and backs off
+    exponentially from 25 ms to 500 ms, so readiness is detected within
+    tens of milliseconds of the server coming up instead of half a second.
+    """
     deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            with urlopen(url, timeout=2) as resp:
+    delay = 0.025
+    conn = http.client.HTTPConnection(host, port, timeout=2)
+    try:
+        while time.monotonic() < deadline:
+            try:
+                conn.request("GET", "/health")
+                resp = conn.getresponse()
+                resp.read()
                 if resp.status == 200:
                     return True
-        except (URLError, OSError):
-            pass
-        time.sleep(0.5)
-    return False
+            except (OSError, http.client.HTTPException):
+                # Server not up yet or connection dropped — reconnect on next probe.
+                conn.close()
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
+        return False
+    finally:
+        conn.close()
 
 
 def main() -> None:
@@ -77,7 +90,7 @@ def main() -> None:
 
     # Wait for backend readiness
     print("  Waiting for backend...")
-    if wait_for_health("http://localhost:8000/health"):
+    if wait_for_health("localhost", 8000):
         print("  Backend ready on http://localhost:8000")
     else:
         print("  Warning: backend did not respond within 15s (continuing anyway)")
@@ -8,10 +8,24 @@ from pathlib import Path
 import pytest
 
 from nextis.assembly.models import AssemblyGraph
+from nextis.control.primitives import PrimitiveLibrary
+from nextis.execution.policy_router import PolicyRouter
 
 FIXTURE_DIR = Path(__file__).resolve().parent.parent / "configs" / "assemblies"
 
 
+@pytest.fixture(scope="session")
+def primitive_library() -> PrimitiveLibrary:
+    """Session-wide primitive registry (stateless across sequencer runs)."""
+    return PrimitiveLibrary()
+
+
+@pytest.fixture(scope="session")
+def policy_router(primitive_library: PrimitiveLibrary) -> PolicyRouter:
+    """Session-wide mock-mode router shared by the sequencer tests."""
+    return PolicyRouter(primitive_library=primitive_library, robot=None)
+
+
 def _primitives_only_assembly_data() -> dict:
     """A 3-step primitive-only assembly for fast, non-blocking tests."""
     return {
@@ -71,21 +85,33 @@ def _primitives_only_assembly_data() -> dict:
     }
 
 
-@pytest.fixture()
-def primitives_only_graph(tmp_path: Path) -> AssemblyGraph:
-    """Write a 3-step primitive-only assembly to tmp_path and return loaded graph."""
+@pytest.fixture(scope="session")
+def _primitives_only_raw(tmp_path_factory: pytest.TempPathFactory) -> AssemblyGraph:
+    """Write and parse the 3-step primitive-only assembly once per session."""
     data = _primitives_only_assembly_data()
-    path = tmp_path / "test_assembly.json"
+    path = tmp_path_factory.mktemp("assemblies") / "test_assembly.json"
     path.write_text(json.dumps(data, indent=2))
     return AssemblyGraph.from_json_file(path)
 
 
 @pytest.fixture()
-def bearing_housing_graph() -> AssemblyGraph:
-    """Load the real bearing_housing_v1 fixture (has a policy step)."""
+def primitives_only_graph(_primitives_only_raw: AssemblyGraph) -> AssemblyGraph:
+    """Per-test deep copy of the cached primitive-only assembly graph."""
+    return _primitives_only_raw.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def _bearing_housing_raw() -> AssemblyGraph:
+    """Parse the real bearing_housing_v1 fixture once per session."""
     return AssemblyGraph.from_json_file(FIXTURE_DIR / "bearing_housing_v1.json")
 
 
+@pytest.fixture()
+def bearing_housing_graph(_bearing_housing_raw: AssemblyGraph) -> AssemblyGraph:
+    """Per-test deep copy of the bearing_housing_v1 graph (has a policy step)."""
+    return _bearing_housing_raw.model_copy(deep=True)
+
+
 @pytest.fixture()
 def analytics_dir(tmp_path: Path) -> Path:
     """Return a clean temporary directory for analytics data."""
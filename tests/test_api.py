@@ -12,6 +12,12 @@ from pathlib import Path
 import pytest
 from fastapi.testclient import TestClient
 
+import nextis.api.routes.analytics as _analytics_mod
+import nextis.api.routes.assembly as _asm_mod
+import nextis.api.routes.execution as _exec_mod
+import nextis.config as _config_mod
+import nextis.state as _state_mod
+
 
 def _test_assembly_data() -> dict:
     """A 2-step primitive-only assembly for API tests."""
@@ -60,42 +66,106 @@ def _test_assembly_data() -> dict:
     }
 
 
+# Serialized once at import — every test writes the same fixture file, so
+# there is no reason to re-dump (or pretty-print) it per test.
+_ASSEMBLY_JSON_BYTES = json.dumps(_test_assembly_data()).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def _client() -> TestClient:
+    """Build the FastAPI app and its TestClient once per session.
+
+    Route registration and Pydantic schema builds happen on first import,
+    and per-test isolation only needs fresh data dirs and module state —
+    so both the app and the client are shared. The client is deliberately
+    NOT entered as a context manager: lifespan startup/shutdown never
+    runs, and routes lazily create SystemState via get_state() anyway.
+    """
+    from nextis.api.app import app
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def ro_configs_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide read-only configs dir holding the fixture assembly.
+
+    Most API tests only read /assemblies/test_assembly, so the directory
+    skeleton and JSON write happen once per session instead of per test.
+    Tests that mutate configs on disk use rw_configs_dir instead.
+    """
+    d = tmp_path_factory.mktemp("configs") / "assemblies"
+    d.mkdir()
+    (d / "test_assembly.json").write_bytes(_ASSEMBLY_JSON_BYTES)
+    return d
+
+
 @pytest.fixture()
-def isolated_app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
-    """Create an isolated FastAPI TestClient with tmp_path for all data dirs."""
-    configs_dir = tmp_path / "configs" / "assemblies"
-    configs_dir.mkdir(parents=True)
-    analytics_dir = tmp_path / "data" / "analytics"
-    analytics_dir.mkdir(parents=True)
+def rw_configs_dir(tmp_path: Path) -> Path:
+    """Per-test writable configs dir seeded with the fixture assembly."""
+    d = tmp_path / "configs" / "assemblies"
+    d.mkdir(parents=True)
+    (d / "test_assembly.json").write_bytes(_ASSEMBLY_JSON_BYTES)
+    return d
 
-    # Write fixture assembly
-    (configs_dir / "test_assembly.json").write_text(json.dumps(_test_assembly_data(), indent=2))
 
-    # Monkeypatch centralized config paths and route-module aliases
-    import nextis.api.routes.analytics as analytics_mod
-    import nextis.api.routes.assembly as asm_mod
-    import nextis.api.routes.execution as exec_mod
-    import nextis.config as config_mod
-    import nextis.state as state_mod
+def _isolate(
+    client: TestClient,
+    configs_dir: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> TestClient:
+    """Point all data dirs at the given paths on the shared client.
 
-    monkeypatch.setattr(config_mod, "ASSEMBLIES_DIR", configs_dir)
-    monkeypatch.setattr(config_mod, "ANALYTICS_DIR", analytics_dir)
-    monkeypatch.setattr(asm_mod, "CONFIGS_DIR", configs_dir)
-    monkeypatch.setattr(exec_mod, "CONFIGS_DIR", configs_dir)
-    monkeypatch.setattr(exec_mod, "ANALYTICS_DIR", analytics_dir)
-    monkeypatch.setattr(analytics_mod, "CONFIGS_DIR", configs_dir)
-    monkeypatch.setattr(analytics_mod, "ANALYTICS_DIR", analytics_dir)
+    Route modules read CONFIGS_DIR/ANALYTICS_DIR at request time, so
+    monkeypatching them per test is safe even with a shared client.
+    """
+    analytics_dir = tmp_path / "data" / "analytics"
+    analytics_dir.mkdir(parents=True)
+    overrides_dir = tmp_path / "configs" / "overrides"
+
+    # Redirect centralized config paths and route-module aliases, and reset
+    # the module-level sequencer/analytics/SystemState singletons.
+    patches = [
+        (_config_mod, "ASSEMBLIES_DIR", configs_dir),
+        (_config_mod, "ANALYTICS_DIR", analytics_dir),
+        (_config_mod, "OVERRIDES_DIR", overrides_dir),
+        (_asm_mod, "CONFIGS_DIR", configs_dir),
+        (_asm_mod, "OVERRIDES_DIR", overrides_dir),
+        (_exec_mod, "CONFIGS_DIR", configs_dir),
+        (_exec_mod, "ANALYTICS_DIR", analytics_dir),
+        (_analytics_mod, "CONFIGS_DIR", configs_dir),
+        (_analytics_mod, "ANALYTICS_DIR", analytics_dir),
+        (_exec_mod, "_sequencer", None),
+        (_exec_mod, "_analytics_store", None),
+        (_state_mod, "_state", None),
+    ]
+    for mod, name, value in patches:
+        monkeypatch.setattr(mod, name, value)
 
-    # Reset module-level sequencer state
-    monkeypatch.setattr(exec_mod, "_sequencer", None)
-    monkeypatch.setattr(exec_mod, "_analytics_store", None)
+    return client
 
-    # Reset SystemState singleton to prevent cross-test pollution
-    monkeypatch.setattr(state_mod, "_state", None)
 
-    from nextis.api.app import app
+@pytest.fixture()
+def ro_app(
+    _client: TestClient,
+    ro_configs_dir: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> TestClient:
+    """Shared client over the session-wide read-only configs dir."""
+    return _isolate(_client, ro_configs_dir, tmp_path, monkeypatch)
 
-    return TestClient(app)
+
+@pytest.fixture()
+def rw_app(
+    _client: TestClient,
+    rw_configs_dir: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> TestClient:
+    """Shared client over a per-test writable configs dir."""
+    return _isolate(_client, rw_configs_dir, tmp_path, monkeypatch)
 
 
 # ------------------------------------------------------------------
@@ -103,8 +173,8 @@ def isolated_app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
 # ------------------------------------------------------------------
 
 
-def test_health(isolated_app: TestClient) -> None:
-    r = isolated_app.get("/health")
+def test_health(ro_app: TestClient) -> None:
+    r = ro_app.get("/health")
     assert r.status_code == 200
     assert r.json() == {"status": "ok"}
 
@@ -114,8 +184,8 @@ def test_health(isolated_app: TestClient) -> None:
 # ------------------------------------------------------------------
 
 
-def test_list_assemblies(isolated_app: TestClient) -> None:
-    r = isolated_app.get("/assemblies")
+def test_list_assemblies(ro_app: TestClient) -> None:
+    r = ro_app.get("/assemblies")
     assert r.status_code == 200
     data = r.json()
     assert len(data) >= 1
@@ -123,8 +193,8 @@ def test_list_assemblies(isolated_app: TestClient) -> None:
     assert "test_assembly" in ids
 
 
-def test_get_assembly(isolated_app: TestClient) -> None:
-    r = isolated_app.get("/assemblies/test_assembly")
+def test_get_assembly(ro_app: TestClient) -> None:
+    r = ro_app.get("/assemblies/test_assembly")
     assert r.status_code == 200
     data = r.json()
     assert data["id"] == "test_assembly"
@@ -134,7 +204,7 @@ def test_get_assembly(isolated_app: TestClient) -> None:
     assert len(data["stepOrder"]) == 2
 
 
-def test_create_assembly(isolated_app: TestClient) -> None:
+def test_create_assembly(rw_app: TestClient) -> None:
     new_graph = {
         "id": "new_assembly",
         "name": "New Assembly",
@@ -155,30 +225,43 @@ def test_create_assembly(isolated_app: TestClient) -> None:
         },
         "stepOrder": ["step_001"],
     }
-    r = isolated_app.post("/assemblies", json=new_graph)
+    r = rw_app.post("/assemblies", json=new_graph)
     assert r.status_code == 201
 
     # Verify it appears in the list
-    r2 = isolated_app.get("/assemblies")
+    r2 = rw_app.get("/assemblies")
     ids = [a["id"] for a in r2.json()]
     assert "new_assembly" in ids
 
 
-def test_update_step(isolated_app: TestClient) -> None:
-    r = isolated_app.patch(
+def test_update_step(rw_app: TestClient) -> None:
+    r = rw_app.patch(
         "/assemblies/test_assembly/steps/step_001",
         json={"name": "Updated pick"},
     )
     assert r.status_code == 200
 
     # Verify the update persisted
-    r2 = isolated_app.get("/assemblies/test_assembly")
+    r2 = rw_app.get("/assemblies/test_assembly")
     step = r2.json()["steps"]["step_001"]
     assert step["name"] == "Updated pick"
 
 
-def test_404_missing_assembly(isolated_app: TestClient) -> None:
-    r = isolated_app.get("/assemblies/nonexistent")
+def test_update_step_rejects_invalid_value(rw_app: TestClient) -> None:
+    r = rw_app.patch(
+        "/assemblies/test_assembly/steps/step_001",
+        json={"maxRetries": "lots"},
+    )
+    assert r.status_code == 422
+
+    # Nothing bad persisted — the assembly still loads
+    r2 = rw_app.get("/assemblies/test_assembly")
+    assert r2.status_code == 200
+    assert r2.json()["steps"]["step_001"]["maxRetries"] != "lots"
+
+
+def test_404_missing_assembly(ro_app: TestClient) -> None:
+    r = ro_app.get("/assemblies/nonexistent")
     assert r.status_code == 404
 
 
@@ -187,12 +270,12 @@ def test_404_missing_assembly(isolated_app: TestClient) -> None:
 # ------------------------------------------------------------------
 
 
-def test_start_execution(isolated_app: TestClient) -> None:
-    r = isolated_app.post("/execution/start", json={"assemblyId": "test_assembly"})
+def test_start_execution(ro_app: TestClient) -> None:
+    r = ro_app.post("/execution/start", json={"assemblyId": "test_assembly"})
     assert r.status_code == 200
 
     # Check that state reflects running (or already complete — stubs are fast)
-    r2 = isolated_app.get("/execution/state")
+    r2 = ro_app.get("/execution/state")
     assert r2.json()["phase"] in ("running", "complete")
     assert r2.json()["assemblyId"] == "test_assembly"
 
@@ -273,15 +356,13 @@ def _mock_plan(parse_result):
 
 
 def test_upload_without_api_key(
-    isolated_app: TestClient,
+    rw_app: TestClient,
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
     """Upload flow works and produces valid assembly without ANTHROPIC_API_KEY."""
-    import nextis.api.routes.assembly as asm_mod
-
     monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
-    monkeypatch.setattr(asm_mod, "HAS_PARSER", True)
+    monkeypatch.setattr(_asm_mod, "HAS_PARSER", True)
 
     # Mock CADParser and SequencePlanner
     class FakeParser:
@@ -292,15 +373,15 @@ def test_upload_without_api_key(
         def plan(self, parse_result):
             return _mock_plan(parse_result)
 
-    monkeypatch.setattr(asm_mod, "CADParser", FakeParser)
-    monkeypatch.setattr(asm_mod, "SequencePlanner", FakePlanner)
+    monkeypatch.setattr(_asm_mod, "CADParser", FakeParser)
+    monkeypatch.setattr(_asm_mod, "SequencePlanner", FakePlanner)
 
     # Create a fake STEP file
     step_file = tmp_path / "test_part.step"
     step_file.write_text("ISO-10303-21;\nHEADER;\nENDSEC;\nDATA;\nENDSEC;\nEND-ISO-10303-21;")
 
     with open(step_file, "rb") as f:
-        r = isolated_app.post(
+        r = rw_app.post(
             "/assemblies/upload",
             files={"file": ("test_part.step", f, "application/octet-stream")},
         )
@@ -317,15 +398,13 @@ def test_upload_without_api_key(
 
 
 def test_upload_progress_includes_ai_stage(
-    isolated_app: TestClient,
+    rw_app: TestClient,
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
     """NDJSON stream includes ai_analysis stage (skipped without API key)."""
-    import nextis.api.routes.assembly as asm_mod
-
     monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
-    monkeypatch.setattr(asm_mod, "HAS_PARSER", True)
+    monkeypatch.setattr(_asm_mod, "HAS_PARSER", True)
 
     class FakeParser:
         def parse(self, *args, **kwargs):
@@ -335,14 +414,14 @@ def test_upload_progress_includes_ai_stage(
         def plan(self, parse_result):
             return _mock_plan(parse_result)
 
-    monkeypatch.setattr(asm_mod, "CADParser", FakeParser)
-    monkeypatch.setattr(asm_mod, "SequencePlanner", FakePlanner)
+    monkeypatch.setattr(_asm_mod, "CADParser", FakeParser)
+    monkeypatch.setattr(_asm_mod, "SequencePlanner", FakePlanner)
 
     step_file = tmp_path / "test_part.step"
     step_file.write_text("ISO-10303-21;\nHEADER;\nENDSEC;\nDATA;\nENDSEC;\nEND-ISO-10303-21;")
 
     with open(step_file, "rb") as f:
-        r = isolated_app.post(
+        r = rw_app.post(
             "/assemblies/upload",
             files={"file": ("test_part.step", f, "application/octet-stream")},
         )
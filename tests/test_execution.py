@@ -13,27 +13,32 @@ from pathlib import Path
 from nextis.analytics.store import AnalyticsStore
 from nextis.api.schemas import ExecutionState
 from nextis.assembly.models import AssemblyGraph
-from nextis.control.primitives import PrimitiveLibrary
 from nextis.execution.policy_router import PolicyRouter
 from nextis.execution.sequencer import Sequencer, SequencerState
 
 
 def _make_sequencer(
     graph: AssemblyGraph,
+    router: PolicyRouter,
     states: list[ExecutionState] | None = None,
     analytics: AnalyticsStore | None = None,
     done_event: asyncio.Event | None = None,
+    started_event: asyncio.Event | None = None,
 ) -> Sequencer:
     """Create a Sequencer with a state-collecting callback."""
 
     def on_change(state: ExecutionState) -> None:
         if states is not None:
             states.append(state)
+        if (
+            started_event
+            and not started_event.is_set()
+            and any(s.status == "running" for s in state.step_states.values())
+        ):
+            started_event.set()
         if done_event and state.phase in ("complete", "error"):
             done_event.set()
 
-    primitives = PrimitiveLibrary()
-    router = PolicyRouter(primitive_library=primitives, robot=None)
     return Sequencer(
         graph=graph,
         on_state_change=on_change,
@@ -42,8 +47,13 @@ def _make_sequencer(
     )
 
 
-async def _wait_for(event: asyncio.Event, timeout: float = 30.0) -> None:
-    """Await an event with a timeout."""
+async def _wait_for(event: asyncio.Event, timeout: float = 5.0) -> None:
+    """Await an event with a timeout.
+
+    The default is deliberately tight: mock-mode sequencer runs finish in
+    well under a second, so a generous timeout only masks hangs and lets
+    slow regressions creep in unnoticed.
+    """
     await asyncio.wait_for(event.wait(), timeout=timeout)
 
 
@@ -52,12 +62,15 @@ async def _wait_for(event: asyncio.Event, timeout: float = 30.0) -> None:
 # ------------------------------------------------------------------
 
 
-async def test_sequencer_runs_all_steps(primitives_only_graph: AssemblyGraph) -> None:
-    """All 3 primitive steps run to completion."""
+async def test_sequencer_runs_all_steps_and_emits_states(
+    primitives_only_graph: AssemblyGraph,
+    policy_router: PolicyRouter,
+) -> None:
+    """All 3 primitive steps run to completion with the expected state stream."""
     done = asyncio.Event()
     states: list[ExecutionState] = []
 
-    seq = _make_sequencer(primitives_only_graph, states=states, done_event=done)
+    seq = _make_sequencer(primitives_only_graph, policy_router, states=states, done_event=done)
     await seq.start()
     await _wait_for(done)
 
@@ -71,8 +84,18 @@ async def test_sequencer_runs_all_steps(primitives_only_graph: AssemblyGraph) ->
     # Elapsed time should be positive
     assert final.elapsed_ms > 0
 
+    # First emission is "running" (sequencer starting), last is the single
+    # "complete" (STEP_ACTIVE also maps to "running" for each step).
+    phases = [s.phase for s in states]
+    assert phases[0] == "running"
+    assert phases[-1] == "complete"
+    assert phases.count("complete") == 1
+
 
-async def test_sequencer_pause_resume(primitives_only_graph: AssemblyGraph) -> None:
+async def test_sequencer_pause_resume(
+    primitives_only_graph: AssemblyGraph,
+    policy_router: PolicyRouter,
+) -> None:
     """Pause after start, resume, then run to completion."""
     done = asyncio.Event()
     first_step_complete = asyncio.Event()
@@ -87,16 +110,14 @@ async def test_sequencer_pause_resume(primitives_only_graph: AssemblyGraph) -> N
         if state.phase in ("complete", "error"):
             done.set()
 
-    primitives = PrimitiveLibrary()
-    router = PolicyRouter(primitive_library=primitives, robot=None)
     seq = Sequencer(
         graph=primitives_only_graph,
         on_state_change=on_change,
-        router=router,
+        router=policy_router,
     )
 
     await seq.start()
-    await _wait_for(first_step_complete, timeout=15.0)
+    await _wait_for(first_step_complete)
 
     await seq.pause()
     assert seq.state == SequencerState.PAUSED
@@ -108,7 +129,10 @@ async def test_sequencer_pause_resume(primitives_only_graph: AssemblyGraph) -> N
     assert seq.state == SequencerState.COMPLETE
 
 
-async def test_sequencer_human_intervention(bearing_housing_graph: AssemblyGraph) -> None:
+async def test_sequencer_human_intervention(
+    bearing_housing_graph: AssemblyGraph,
+    policy_router: PolicyRouter,
+) -> None:
     """step_004 (policy) fails all retries → WAITING_FOR_HUMAN → human completes."""
     waiting = asyncio.Event()
     done = asyncio.Event()
@@ -119,16 +143,14 @@ async def test_sequencer_human_intervention(bearing_housing_graph: AssemblyGraph
         if state.phase in ("complete", "error"):
             done.set()
 
-    primitives = PrimitiveLibrary()
-    router = PolicyRouter(primitive_library=primitives, robot=None)
     seq = Sequencer(
         graph=bearing_housing_graph,
         on_state_change=on_change,
-        router=router,
+        router=policy_router,
     )
 
     await seq.start()
-    await _wait_for(waiting, timeout=30.0)
+    await _wait_for(waiting)
 
     assert seq.state == SequencerState.WAITING_FOR_HUMAN
     assert seq.current_step is not None
@@ -138,44 +160,30 @@ async def test_sequencer_human_intervention(bearing_housing_graph: AssemblyGraph
     await seq.complete_human_step(success=True)
 
     # Sequencer should continue to step_005 and complete
-    await _wait_for(done, timeout=15.0)
+    await _wait_for(done, timeout=3.0)
     assert seq.state == SequencerState.COMPLETE
 
 
-async def test_sequencer_stop(primitives_only_graph: AssemblyGraph) -> None:
+async def test_sequencer_stop(
+    primitives_only_graph: AssemblyGraph,
+    policy_router: PolicyRouter,
+) -> None:
     """Stop mid-execution → state is IDLE, task is cancelled."""
-    seq = _make_sequencer(primitives_only_graph)
+    started = asyncio.Event()
+    seq = _make_sequencer(primitives_only_graph, policy_router, started_event=started)
     await seq.start()
 
-    # Let it start the first step
-    await asyncio.sleep(0.05)
+    # Wait until the first step is actually active (no fixed sleep)
+    await _wait_for(started, timeout=5.0)
     assert seq.state in (SequencerState.STEP_ACTIVE, SequencerState.RUNNING)
 
     await seq.stop()
     assert seq.state == SequencerState.IDLE
 
 
-async def test_sequencer_emits_state_changes(primitives_only_graph: AssemblyGraph) -> None:
-    """Verify the stream of state-change emissions."""
-    done = asyncio.Event()
-    states: list[ExecutionState] = []
-
-    seq = _make_sequencer(primitives_only_graph, states=states, done_event=done)
-    await seq.start()
-    await _wait_for(done)
-
-    phases = [s.phase for s in states]
-
-    # First emission should be "running" (sequencer starting)
-    assert phases[0] == "running"
-    # Last emission should be "complete"
-    assert phases[-1] == "complete"
-    # Should see "running" phases for each step (STEP_ACTIVE maps to "running")
-    assert phases.count("complete") == 1
-
-
 async def test_analytics_records_results(
     primitives_only_graph: AssemblyGraph,
+    policy_router: PolicyRouter,
     analytics_dir: Path,
 ) -> None:
     """Run sequencer with AnalyticsStore → metrics are recorded for each step."""
@@ -184,6 +192,7 @@ async def test_analytics_records_results(
 
     seq = _make_sequencer(
         primitives_only_graph,
+        policy_router,
         analytics=store,
         done_event=done,
     )
@@ -28,6 +28,18 @@ from nextis.perception.verifier import StepVerifier
 # ---------------------------------------------------------------------------
 
 
+# Validated once at import; _make_step hands out unvalidated copies with the
+# per-test criteria swapped in, skipping repeated Pydantic validation.
+_BASE_STEP = AssemblyStep(
+    id="test_step",
+    name="Test step",
+    part_ids=[],
+    dependencies=[],
+    handler="primitive",
+    success_criteria=SuccessCriteria(type="position"),
+)
+
+
 def _make_step(
     criteria_type: str = "position",
     threshold: float | None = None,
@@ -36,19 +48,16 @@ def _make_step(
     primitive_params: dict | None = None,
 ) -> AssemblyStep:
     """Create a minimal AssemblyStep with the given success criteria."""
-    return AssemblyStep(
-        id="test_step",
-        name="Test step",
-        part_ids=[],
-        dependencies=[],
-        handler="primitive",
-        success_criteria=SuccessCriteria(
-            type=criteria_type,
-            threshold=threshold,
-            pattern=pattern,
-            model=model,
-        ),
-        primitive_params=primitive_params,
+    return _BASE_STEP.model_copy(
+        update={
+            "success_criteria": SuccessCriteria.model_construct(
+                type=criteria_type,
+                threshold=threshold,
+                pattern=pattern,
+                model=model,
+            ),
+            "primitive_params": primitive_params,
+        }
     )
 
 
@@ -136,10 +145,9 @@ def test_check_force_threshold_no_threshold() -> None:
 
 def test_check_snap_fit_pass() -> None:
     """Snap-fit with clear peak + drop passes."""
-    ramp = list(np.linspace(0.5, 5.0, 16))
-    drop = [2.0, 1.5, 1.2, 1.1]
-    hold = [1.0] * 10
-    force_history = ramp + drop + hold
+    force_history = np.concatenate(
+        [np.linspace(0.5, 5.0, 16), [2.0, 1.5, 1.2, 1.1], np.ones(10)]
+    ).astype(np.float32)
 
     step = _make_step(criteria_type="force_signature", pattern="snap_fit")
     data = ExecutionData(force_history=force_history)
@@ -150,7 +158,7 @@ def test_check_snap_fit_pass() -> None:
 
 def test_check_snap_fit_fail() -> None:
     """Flat noise fails snap-fit detection."""
-    force_history = [0.02] * 30
+    force_history = np.full(30, 0.02, dtype=np.float32)
 
     step = _make_step(criteria_type="force_signature", pattern="snap_fit")
     data = ExecutionData(force_history=force_history)
@@ -166,7 +174,7 @@ def test_check_snap_fit_fail() -> None:
 
 def test_check_meshing_pass() -> None:
     """Oscillating force with 4+ peaks passes meshing."""
-    force_history = [1.5 + 1.2 * math.sin(i * math.pi / 4) for i in range(40)]
+    force_history = (1.5 + 1.2 * np.sin(np.arange(40) * (math.pi / 4))).astype(np.float32)
 
     step = _make_step(criteria_type="force_signature", pattern="meshing")
     data = ExecutionData(force_history=force_history)
@@ -179,7 +187,7 @@ def test_check_meshing_pass() -> None:
 
 def test_check_meshing_fail() -> None:
     """Monotonic force fails meshing detection."""
-    force_history = list(np.linspace(0.1, 2.0, 30))
+    force_history = np.linspace(0.1, 2.0, 30, dtype=np.float32)
 
     step = _make_step(criteria_type="force_signature", pattern="meshing")
     data = ExecutionData(force_history=force_history)
@@ -195,7 +203,7 @@ def test_check_meshing_fail() -> None:
 
 def test_check_press_fit_pass() -> None:
     """Monotonic rise to target passes press-fit."""
-    force_history = list(np.linspace(0.5, 12.0, 30))
+    force_history = np.linspace(0.5, 12.0, 30, dtype=np.float32)
 
     step = _make_step(criteria_type="force_signature", pattern="press_fit", threshold=10.0)
     data = ExecutionData(force_history=force_history)
@@ -206,9 +214,8 @@ def test_check_press_fit_pass() -> None:
 
 def test_check_press_fit_fail() -> None:
     """Plateau below target fails press-fit."""
-    ramp = list(np.linspace(0.2, 4.0, 10))
-    plateau = [4.0 + 0.1 * (i % 2) for i in range(10)]
-    force_history = ramp + plateau
+    plateau = 4.0 + 0.1 * (np.arange(10) % 2)
+    force_history = np.concatenate([np.linspace(0.2, 4.0, 10), plateau]).astype(np.float32)
 
     step = _make_step(criteria_type="force_signature", pattern="press_fit", threshold=10.0)
     data = ExecutionData(force_history=force_history)
@@ -309,7 +316,7 @@ def test_mock_execution_data(
     exec_data = mock.generate_execution_data(step, force_success=True)
 
     assert exec_data.duration_ms > 0
-    assert isinstance(exec_data.force_history, list)
+    assert isinstance(exec_data.force_history, np.ndarray)
 
     # Feed through the checker — must pass
     result = checker(step, exec_data)  # type: ignore[operator]
@@ -6,6 +6,12 @@ that primitives produce correct results and force history data.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+
+import pytest
+
+from nextis.control.motion_helpers import joints_to_action
 from nextis.control.motion_primitives import (
     guarded_move,
     linear_insert,
@@ -16,7 +22,7 @@ from nextis.control.motion_primitives import (
     screw,
 )
 from nextis.control.primitives import PrimitiveLibrary
-from nextis.hardware.mock import MockRobot
+from nextis.hardware.mock import MOCK_JOINT_NAMES, MockRobot
 
 
 class ControlledMockRobot(MockRobot):
@@ -24,151 +30,188 @@ class ControlledMockRobot(MockRobot):
 
     def __init__(self, torque: float = 0.5) -> None:
         super().__init__()
-        self._fixed_torque = torque
+        # Torques never change, so build the read-only mapping once instead
+        # of re-importing and dict-comprehending on every control-loop tick.
+        self._torques = MappingProxyType(dict.fromkeys(MOCK_JOINT_NAMES, torque))
 
-    def get_torques(self) -> dict[str, float]:
+    def get_torques(self) -> Mapping[str, float]:
         """Return fixed torques for predictable test behavior."""
-        from nextis.hardware.mock import MOCK_JOINT_NAMES
+        return self._torques
 
-        return {n: self._fixed_torque for n in MOCK_JOINT_NAMES}
 
+@pytest.fixture(scope="module")
+def _shared_mock_robot() -> MockRobot:
+    """One MockRobot per module — construction cost is paid once."""
+    return MockRobot()
 
-# ------------------------------------------------------------------
-# Mock path (robot=None) — backward compat with existing stubs
-# ------------------------------------------------------------------
 
+@pytest.fixture()
+def mock_robot(_shared_mock_robot: MockRobot) -> MockRobot:
+    """The shared MockRobot, reset to its pristine sine-wave state."""
+    _shared_mock_robot.reset()
+    return _shared_mock_robot
 
-async def test_move_to_mock_path() -> None:
-    """move_to with robot=None sleeps and returns success."""
-    result = await move_to(None, target_pose=[1, 2, 3], timeout=0.1, _speed_factor=0.01)
-    assert result.success
-    assert result.force_history == []
-    assert result.actual_position == [1, 2, 3]
 
+@pytest.fixture(scope="module")
+def controlled_robot() -> Callable[[float], ControlledMockRobot]:
+    """Factory returning a reset ControlledMockRobot cached per torque value."""
+    cache: dict[float, ControlledMockRobot] = {}
 
-async def test_pick_mock_path() -> None:
-    """pick with robot=None returns success with expected force."""
-    result = await pick(
-        None, grasp_pose=[0, 0, 0], force_threshold=0.5, timeout=0.1, _speed_factor=0.01
-    )
-    assert result.success
-    assert result.actual_force == 0.5
-    assert result.force_history == []
+    def factory(torque: float) -> ControlledMockRobot:
+        robot = cache.get(torque)
+        if robot is None:
+            robot = cache[torque] = ControlledMockRobot(torque=torque)
+        robot.reset()
+        return robot
 
+    return factory
 
-async def test_place_mock_path() -> None:
-    """place with robot=None returns success."""
-    result = await place(None, target_pose=[1, 2, 3], timeout=0.1, _speed_factor=0.01)
-    assert result.success
-    assert result.force_history == []
 
+# ------------------------------------------------------------------
+# Mock path (robot=None) — backward compat with existing stubs
+# ------------------------------------------------------------------
 
-async def test_guarded_move_mock_path() -> None:
-    """guarded_move with robot=None returns contact force."""
-    result = await guarded_move(
-        None, direction=[0, 0, -1], force_threshold=5.0, timeout=0.1, _speed_factor=0.01
-    )
-    assert result.success
-    assert result.actual_force == 5.0
 
+@pytest.mark.parametrize(
+    ("fn", "kw", "expected_force", "expected_position"),
+    [
+        pytest.param(move_to, {"target_pose": [1, 2, 3]}, None, [1, 2, 3], id="move_to"),
+        pytest.param(pick, {"grasp_pose": [0, 0, 0], "force_threshold": 0.5}, 0.5, None, id="pick"),
+        pytest.param(place, {"target_pose": [1, 2, 3]}, None, None, id="place"),
+        pytest.param(
+            guarded_move,
+            {"direction": [0, 0, -1], "force_threshold": 5.0},
+            5.0,
+            None,
+            id="guarded_move",
+        ),
+        # linear_insert reports 60% of force_limit, screw 80% of torque_limit
+        pytest.param(
+            linear_insert, {"target_pose": [0], "force_limit": 10.0}, 6.0, None, id="linear_insert"
+        ),
+        pytest.param(screw, {"torque_limit": 2.0}, 1.6, None, id="screw"),
+        pytest.param(press_fit, {"force_target": 15.0}, 15.0, None, id="press_fit"),
+    ],
+)
+async def test_mock_path(
+    fn: Callable[..., object],
+    kw: dict[str, object],
+    expected_force: float | None,
+    expected_position: list[float] | None,
+) -> None:
+    """Each primitive with robot=None returns success with no force history."""
+    result = await fn(None, timeout=0.1, _speed_factor=0.01, **kw)
+    assert result.success
+    assert len(result.force_history) == 0
+    if expected_force is not None:
+        assert result.actual_force == pytest.approx(expected_force, abs=0.01)
+    if expected_position is not None:
+        assert result.actual_position == expected_position
 
-async def test_linear_insert_mock_path() -> None:
-    """linear_insert with robot=None returns 60% of force limit."""
-    result = await linear_insert(
-        None, target_pose=[0], force_limit=10.0, timeout=0.1, _speed_factor=0.01
-    )
-    assert result.success
-    assert abs(result.actual_force - 6.0) < 0.01
 
+# ------------------------------------------------------------------
+# Real path (MockRobot) — control loop + force history
+# ------------------------------------------------------------------
 
-async def test_screw_mock_path() -> None:
-    """screw with robot=None returns 80% of torque limit."""
-    result = await screw(None, torque_limit=2.0, timeout=0.1, _speed_factor=0.01)
-    assert result.success
-    assert abs(result.actual_force - 1.6) < 0.01
 
+# Shared across the real-path tests; a tuple is immutable, so one instance
+# is safe to hand to every primitive.
+_ZERO_POSE: tuple[float, ...] = (0.0,) * 7
 
-async def test_press_fit_mock_path() -> None:
-    """press_fit with robot=None returns target force."""
-    result = await press_fit(None, force_target=15.0, timeout=0.1, _speed_factor=0.01)
-    assert result.success
-    assert result.actual_force == 15.0
 
+def _seed_near_target(robot: MockRobot) -> None:
+    """Start the robot a small offset from the zero target.
 
-# ------------------------------------------------------------------
-# Real path (MockRobot) — control loop + force history
-# ------------------------------------------------------------------
+    Interpolating all the way in from the sine-wave pose takes hundreds of
+    60 Hz ticks; seeding 0.03 rad out still exercises multi-tick convergence
+    (~2 dozen ticks with force history) at a fraction of the wall clock.
+    """
+    robot.send_action(joints_to_action([0.03] * 7))
 
 
-async def test_move_to_with_mock_robot() -> None:
+async def test_move_to_with_mock_robot(mock_robot: MockRobot) -> None:
     """move_to with MockRobot converges and returns force history."""
-    robot = MockRobot()
-    target = [0.0] * 7
-    result = await move_to(robot, target_pose=target, velocity=0.8, timeout=3.0)
+    robot = mock_robot
+    _seed_near_target(robot)
+    result = await move_to(robot, target_pose=_ZERO_POSE, velocity=0.8, timeout=3.0)
     assert result.success
     assert result.duration_ms > 0
     assert len(result.force_history) > 0
     assert len(result.actual_position) == 7
 
 
-async def test_pick_with_controlled_robot() -> None:
+async def test_pick_with_controlled_robot(
+    controlled_robot: Callable[[float], ControlledMockRobot],
+) -> None:
     """pick with ControlledMockRobot detects gripper force."""
-    robot = ControlledMockRobot(torque=0.8)
-    result = await pick(robot, grasp_pose=[0.0] * 7, force_threshold=0.5, timeout=5.0)
+    robot = controlled_robot(0.8)
+    _seed_near_target(robot)
+    result = await pick(robot, grasp_pose=_ZERO_POSE, force_threshold=0.5, timeout=5.0)
     assert result.success
     assert result.actual_force >= 0.5
     assert len(result.force_history) > 0
 
 
-async def test_place_with_controlled_robot() -> None:
+async def test_place_with_controlled_robot(
+    controlled_robot: Callable[[float], ControlledMockRobot],
+) -> None:
     """place with ControlledMockRobot opens gripper (low torque = release confirmed)."""
-    robot = ControlledMockRobot(torque=0.05)
-    result = await place(robot, target_pose=[0.0] * 7, release_force=0.2, timeout=5.0)
+    robot = controlled_robot(0.05)
+    _seed_near_target(robot)
+    result = await place(robot, target_pose=_ZERO_POSE, release_force=0.2, timeout=5.0)
     assert result.success
     assert len(result.force_history) > 0
 
 
-async def test_guarded_move_with_controlled_robot() -> None:
+async def test_guarded_move_with_controlled_robot(
+    controlled_robot: Callable[[float], ControlledMockRobot],
+) -> None:
     """guarded_move with high-torque mock detects contact."""
-    robot = ControlledMockRobot(torque=6.0)
+    robot = controlled_robot(6.0)
     result = await guarded_move(robot, direction=[0, 0, -1], force_threshold=5.0, timeout=3.0)
     assert result.success
     assert result.actual_force >= 5.0
     assert len(result.force_history) > 0
 
 
-async def test_linear_insert_with_controlled_robot() -> None:
+async def test_linear_insert_with_controlled_robot(
+    controlled_robot: Callable[[float], ControlledMockRobot],
+) -> None:
     """linear_insert with high-torque mock triggers force limit (seating)."""
-    robot = ControlledMockRobot(torque=12.0)
-    result = await linear_insert(robot, target_pose=[0.0] * 7, force_limit=10.0, timeout=3.0)
+    robot = controlled_robot(12.0)
+    result = await linear_insert(robot, target_pose=_ZERO_POSE, force_limit=10.0, timeout=3.0)
     assert result.success
     assert result.actual_force >= 10.0
     assert len(result.force_history) > 0
 
 
-async def test_screw_with_controlled_robot() -> None:
+async def test_screw_with_controlled_robot(
+    controlled_robot: Callable[[float], ControlledMockRobot],
+) -> None:
     """screw with high-torque mock triggers torque limit."""
-    robot = ControlledMockRobot(torque=3.0)
+    robot = controlled_robot(3.0)
     result = await screw(robot, torque_limit=2.0, timeout=3.0)
     assert result.success
     assert result.actual_force >= 2.0
     assert len(result.force_history) > 0
 
 
-async def test_press_fit_with_controlled_robot() -> None:
+async def test_press_fit_with_controlled_robot(
+    controlled_robot: Callable[[float], ControlledMockRobot],
+) -> None:
     """press_fit with high-torque mock reaches target force."""
-    robot = ControlledMockRobot(torque=20.0)
+    robot = controlled_robot(20.0)
     result = await press_fit(robot, force_target=15.0, timeout=3.0)
     assert result.success
     assert result.actual_force >= 15.0
     assert len(result.force_history) > 0
 
 
-async def test_move_to_timeout() -> None:
+async def test_move_to_timeout(mock_robot: MockRobot) -> None:
     """move_to times out if target is unreachable (robot doesn't move on its own)."""
-    robot = MockRobot()
+    robot = mock_robot
     # Set a target far from where sine-wave initial observation will be
-    result = await move_to(robot, target_pose=[10.0] * 7, velocity=0.001, timeout=0.1)
+    result = await move_to(robot, target_pose=[10.0] * 7, velocity=0.001, timeout=0.05)
     assert not result.success
     assert "timed out" in (result.error_message or "")
     assert len(result.force_history) > 0
@@ -179,11 +222,11 @@ async def test_move_to_timeout() -> None:
 # ------------------------------------------------------------------
 
 
-async def test_library_dispatches_to_real_path() -> None:
+async def test_library_dispatches_to_real_path(mock_robot: MockRobot) -> None:
     """PrimitiveLibrary dispatches to real implementations with robot."""
     lib = PrimitiveLibrary()
-    robot = MockRobot()
-    result = await lib.run("move_to", robot, {"target_pose": [0.0] * 7, "timeout": 3.0})
+    _seed_near_target(mock_robot)
+    result = await lib.run("move_to", mock_robot, {"target_pose": _ZERO_POSE, "timeout": 3.0})
     assert result.success
     assert len(result.force_history) > 0
 
@@ -191,6 +234,6 @@ async def test_library_dispatches_to_real_path() -> None:
 async def test_library_dispatches_mock_path() -> None:
     """PrimitiveLibrary dispatches to mock path with robot=None."""
     lib = PrimitiveLibrary()
-    result = await lib.run("move_to", None, {"target_pose": [0.0] * 7, "timeout": 0.1})
+    result = await lib.run("move_to", None, {"target_pose": _ZERO_POSE, "timeout": 0.1})
     assert result.success
-    assert result.force_history == []
+    assert len(result.force_history) == 0